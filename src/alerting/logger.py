@@ -1,70 +1,238 @@
 """Alert logging - formats and outputs alerts to console and file."""
 
 import logging
+import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    WatchedFileHandler,
+)
 from pathlib import Path
 
 from ..db import Alert
 
+logger = logging.getLogger(__name__)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue that never blocks the producer.
+
+    When the queue is full the record is either dropped or handled
+    synchronously by the fallback handlers, depending on ``drop_on_full``.
+    """
+
+    DROP_WARNING_INTERVAL = 60  # seconds
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        fallback: list[logging.Handler],
+        drop_on_full: bool = False,
+    ):
+        super().__init__(log_queue)
+        self.fallback = fallback
+        self.drop_on_full = drop_on_full
+        self._dropped = 0
+        self._last_drop_warning = 0.0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.drop_on_full:
+                self._record_drop()
+                return
+            for handler in self.fallback:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+    def _record_drop(self):
+        """Count a dropped record and warn at most once per interval."""
+        self._dropped += 1
+        now = time.monotonic()
+        if now - self._last_drop_warning >= self.DROP_WARNING_INTERVAL:
+            logger.warning(f"Alert log queue full, dropped {self._dropped} record(s)")
+            self._dropped = 0
+            self._last_drop_warning = now
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that writes through a large block buffer.
+
+    Records are not flushed individually; the buffer is written out when it
+    fills, on rollover, or when flush() is called explicitly. The file size is
+    tracked with a running byte counter instead of seeking the stream, which
+    would force a flush on every record. Every SIZE_CHECK_INTERVAL records the
+    counter is reconciled against the real file size, so external truncation
+    is still noticed.
+    """
+
+    BUFFER_SIZE = 128 * 1024  # bytes
+    SIZE_CHECK_INTERVAL = 256  # records, must be a power of two
+
+    _bytes_written = 0
+    _emit_count = 0
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding or "utf-8",
+            errors=self.errors,
+        )
+        self._bytes_written = (
+            os.path.getsize(self.baseFilename) if "a" in self.mode else 0
+        )
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        return self._should_rollover(self._encoded_size(self.format(record)))
+
+    def _should_rollover(self, size: int) -> bool:
+        # An empty file is never rolled over, matching RotatingFileHandler
+        return (
+            self.maxBytes > 0
+            and self._bytes_written > 0
+            and self._bytes_written + size >= self.maxBytes
+        )
+
+    def _sync_size(self):
+        """Reset the byte counter from the file's actual size."""
+        # Buffered bytes are invisible to fstat, so write them out first
+        self.stream.flush()
+        self._bytes_written = os.fstat(self.stream.fileno()).st_size
+
+    def _encoded_size(self, msg: str) -> int:
+        return len((msg + self.terminator).encode(self.encoding or "utf-8", "replace"))
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record)
+            size = self._encoded_size(msg)
+            self._emit_count = (self._emit_count + 1) & (self.SIZE_CHECK_INTERVAL - 1)
+            if not self._emit_count:
+                self._sync_size()
+            if self._should_rollover(size):
+                self.doRollover()
+            self.stream.write(msg + self.terminator)
+            self._bytes_written += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+@lru_cache(maxsize=32)
+def _alert_type_label(alert_type: str) -> str:
+    """Turn an alert type like ``low_history_large_trade`` into a heading."""
+    return alert_type.upper().replace("_", " ")
+
 
 class AlertFormatter(logging.Formatter):
     """Custom formatter for alert messages."""
 
-    ALERT_FORMAT = """
-================================================================================
-{timestamp} | ALERT | {alert_type}
---------------------------------------------------------------------------------
-  Wallet:      {wallet}
-  Trade Size:  ${trade_size:,.2f}
-  History:     {trade_count} previous trades
-  Market:      {market}
-  Outcome:     {outcome}
-  Side:        {side}
-  Tx:          {tx_hash}
-================================================================================
-"""
-
     def format(self, record: logging.LogRecord) -> str:
         if hasattr(record, "alert"):
             return self._format_alert(record.alert)
         return super().format(record)
 
     def _format_alert(self, alert: Alert) -> str:
-        return self.ALERT_FORMAT.format(
-            timestamp=alert.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            alert_type=alert.alert_type.upper().replace("_", " "),
-            wallet=alert.wallet_address,
-            trade_size=alert.trade_size_usd,
-            trade_count=alert.wallet_trade_count or 0,
-            market=alert.market_name or "Unknown",
-            outcome=alert.outcome or "Unknown",
-            side=alert.side or "Unknown",
-            tx_hash=alert.transaction_hash or "Unknown",
-        )
+        # isoformat is much cheaper than strftime; trim any UTC offset
+        timestamp = alert.created_at.isoformat(" ", "seconds")[:19]
+        return f"""
+================================================================================
+{timestamp} | ALERT | {_alert_type_label(alert.alert_type)}
+--------------------------------------------------------------------------------
+  Wallet:      {alert.wallet_address}
+  Trade Size:  ${alert.trade_size_usd:,.2f}
+  History:     {alert.wallet_trade_count or 0} previous trades
+  Market:      {alert.market_name or "Unknown"}
+  Outcome:     {alert.outcome or "Unknown"}
+  Side:        {alert.side or "Unknown"}
+  Tx:          {alert.transaction_hash or "Unknown"}
+================================================================================
+"""
 
 
 class AlertLogger:
     """Handles alert output to console and file."""
 
+    FILE_BUFFER_CAPACITY = 64  # records
+    FILE_FLUSH_INTERVAL = 0.25  # seconds
+
     def __init__(
         self,
         log_file: str | Path,
         log_level: str = "INFO",
         max_file_size_mb: int = 10,
         backup_count: int = 5,
+        rotation_mode: str = "inprocess",
+        max_queue_size: int = 10_000,
+        drop_on_full: bool = False,
     ):
+        """
+        Args:
+            log_file: Path of the alert log file
+            log_level: Minimum level written to console and file
+            max_file_size_mb: Rollover size for in-process rotation
+            backup_count: Rotated files to keep for in-process rotation
+            rotation_mode: "inprocess" rotates by size inside the watcher;
+                "external" leaves rotation to logrotate and reopens the file
+                when it is moved. A matching logrotate config:
+
+                    logs/alerts.log {
+                        size 10M
+                        rotate 5
+                        missingok
+                        notifempty
+                    }
+
+            max_queue_size: Records that may wait for the writer thread
+            drop_on_full: When the queue is full, drop records instead of
+                writing them synchronously on the caller's thread
+        """
+        if rotation_mode not in ("inprocess", "external"):
+            raise ValueError(f"Unknown rotation_mode: {rotation_mode}")
+
         self.log_file = Path(log_file)
         self.log_level = getattr(logging, log_level.upper(), logging.INFO)
         self.max_file_size = max_file_size_mb * 1024 * 1024
         self.backup_count = backup_count
+        self.rotation_mode = rotation_mode
+        self.drop_on_full = drop_on_full
 
         self._logger = logging.getLogger("polymarket_watcher.alerts")
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._listener: QueueListener | None = None
+        self._handlers: list[logging.Handler] = []
+        self._file_buffer: MemoryHandler | None = None
+        self._file_handler: logging.FileHandler | None = None
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
         self._setup_logging()
 
     def _setup_logging(self):
-        """Configure logging handlers."""
+        """
+        Configure logging handlers.
+
+        The logger itself only carries a QueueHandler; the console and file
+        handlers run on a QueueListener background thread so alert producers
+        never block on terminal or disk I/O. File writes are additionally
+        buffered and flushed on a timer so bursts coalesce into one write.
+        """
         self._logger.setLevel(self.log_level)
         self._logger.handlers.clear()
 
@@ -75,31 +243,87 @@ class AlertLogger:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(self.log_level)
         console_handler.setFormatter(AlertFormatter())
-        self._logger.addHandler(console_handler)
 
-        # File handler with rotation
-        file_handler = RotatingFileHandler(
-            self.log_file,
-            maxBytes=self.max_file_size,
-            backupCount=self.backup_count,
-        )
+        # File handler with rotation (or reopen-on-move for external rotation)
+        file_handler: logging.FileHandler
+        if self.rotation_mode == "external":
+            file_handler = WatchedFileHandler(self.log_file)
+        else:
+            file_handler = BufferedRotatingFileHandler(
+                self.log_file,
+                maxBytes=self.max_file_size,
+                backupCount=self.backup_count,
+            )
         file_handler.setLevel(self.log_level)
         file_handler.setFormatter(AlertFormatter())
-        self._logger.addHandler(file_handler)
+
+        # Buffer file records; console stays unbuffered so alerts show instantly
+        self._file_buffer = MemoryHandler(
+            capacity=self.FILE_BUFFER_CAPACITY,
+            flushLevel=logging.CRITICAL,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        self._file_buffer.setLevel(self.log_level)
+
+        self._file_handler = file_handler
+        self._handlers = [console_handler, self._file_buffer, file_handler]
+        self._logger.addHandler(
+            BoundedQueueHandler(
+                self._queue,
+                fallback=[console_handler, self._file_buffer],
+                drop_on_full=self.drop_on_full,
+            )
+        )
+
+        self._listener = QueueListener(
+            self._queue,
+            console_handler,
+            self._file_buffer,
+            respect_handler_level=True,
+        )
+        self._listener.start()
+
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="alert-log-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _flush_loop(self):
+        """Periodically flush buffered file records."""
+        while not self._flush_stop.wait(self.FILE_FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        """Write any buffered records to the log file."""
+        if self._file_buffer:
+            self._file_buffer.flush()
+        if self._file_handler:
+            self._file_handler.flush()
+
+    def close(self):
+        """Drain pending records and close all handlers."""
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+
+        if self._flush_thread:
+            self._flush_stop.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+
+        self.flush()
+        for handler in self._handlers:
+            handler.close()
+        self._handlers = []
+        self._file_buffer = None
+        self._file_handler = None
 
     def log_alert(self, alert: Alert):
         """Log an alert to console and file."""
-        record = self._logger.makeRecord(
-            name="polymarket_watcher.alerts",
-            level=logging.WARNING,
-            fn="",
-            lno=0,
-            msg="Alert triggered",
-            args=(),
-            exc_info=None,
-        )
-        record.alert = alert
-        self._logger.handle(record)
+        # warning() checks the level before building a record
+        self._logger.warning("Alert triggered", extra={"alert": alert})
 
     def info(self, message: str):
         """Log an info message."""
@@ -118,6 +342,12 @@ def setup_app_logging(level: str = "INFO"):
     """Set up application-wide logging."""
     log_level = getattr(logging, level.upper(), logging.INFO)
 
+    # None of our formats use thread or process fields, so skip collecting
+    # them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Configure root logger
     logging.basicConfig(
         level=log_level,
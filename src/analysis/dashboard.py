@@ -1,11 +1,69 @@
-"""Console dashboard for displaying wallet analysis results."""
+"""Console dashboard for displaying wallet analysis results.
 
+Each dashboard is rendered by a ``render_*`` generator that yields lines; the
+matching ``print_*`` function writes them out in ~64 KB chunks rather than
+issuing one ``print()`` per line.
+"""
+
+import codecs
+import os
+import sys
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Iterable, Iterator, TextIO
 
 from ..api.data_api import PortfolioSummary, Position
 from .profitability import StrategyInsights, TradeAnalysis, WalletProfile
 
+# Target size of each write to the output stream
+_WRITE_CHUNK_SIZE = 64 * 1024
+
+# ANSI color codes
+_GREEN = "\033[92m"
+_RED = "\033[91m"
+_YELLOW = "\033[93m"
+_RESET = "\033[0m"
+
+# (prefix, suffix) for P&L values, indexed by ``pnl >= 0``
+_PNL_COLORS = ((_RED, _RESET), (_GREEN, _RESET))
+
+# Row templates for the position tables
+_POSITION_ROW = "    {market:<45} {side:<6} {pnl:>15}  {trades:>5}".format
+_PORTFOLIO_ROW = "    {market:<42} {outcome:<8} {value:>10} {pnl:>15}".format
+
+# Profile fields shown in each comparison row, fetched in one C-level call
+_comparison_fields = attrgetter(
+    "total_pnl",
+    "total_volume",
+    "win_rate",
+    "total_trades",
+    "username",
+    "address",
+    "strategy",
+)
+
+# Border strings
+_EQ80 = "═" * 80
+_DASH72 = "─" * 72
+_DASH80 = "─" * 80
+_TABLE_RULE = "    " + _DASH72
+_COMPARISON_RULE = "  " + "─" * 96
 
+
+def _banner(title: str, width: int) -> str:
+    """Build a boxed title banner."""
+    line = "═" * width
+    return f"╔{line}╗\n║{title.center(width)}║\n╚{line}╝"
+
+
+_ANALYSIS_BANNER = _banner(" POLYMARKET WALLET ANALYSIS ", 78)
+_PORTFOLIO_BANNER = _banner(" OPEN POSITIONS SUMMARY ", 78)
+_COMPARISON_BANNER = _banner(" WALLET COMPARISON ", 98)
+_TOP_POSITIONS_RULE = "─── Top Positions by P&L " + "─" * 53
+
+
+@lru_cache(maxsize=2048)
 def format_currency(value: float) -> str:
     """Format a number as currency."""
     if value >= 0:
@@ -13,6 +71,7 @@ def format_currency(value: float) -> str:
     return f"-${abs(value):,.2f}"
 
 
+@lru_cache(maxsize=2048)
 def format_large_number(value: float) -> str:
     """Format large numbers with K/M suffixes."""
     if value >= 1_000_000:
@@ -22,64 +81,153 @@ def format_large_number(value: float) -> str:
     return f"${value:.2f}"
 
 
+@lru_cache(maxsize=4096)
+def _colored_currency(value: float) -> str:
+    """format_currency wrapped in the green/red P&L color."""
+    pre, post = _PNL_COLORS[value >= 0]
+    return f"{pre}{format_currency(value)}{post}"
+
+
+@lru_cache(maxsize=4096)
+def _colored_large_number(value: float) -> str:
+    """format_large_number wrapped in the green/red P&L color."""
+    pre, post = _PNL_COLORS[value >= 0]
+    return f"{pre}{format_large_number(value)}{post}"
+
+
+@lru_cache(maxsize=8)
+def _bar_table(width: int) -> tuple[str, ...]:
+    """All bars of the given width, indexed by number of filled cells."""
+    return tuple("█" * i + "░" * (width - i) for i in range(width + 1))
+
+
 def create_bar(value: float, max_value: float, width: int = 20) -> str:
     """Create a simple ASCII progress bar."""
     if max_value <= 0:
         return " " * width
     filled = int((value / max_value) * width)
-    filled = min(filled, width)
-    return "█" * filled + "░" * (width - filled)
+    return _bar_table(width)[max(0, min(filled, width))]
+
+
+@lru_cache(maxsize=64)
+def format_header(title: str, width: int = 80) -> str:
+    """Format a section header."""
+    line = _EQ80 if width == 80 else "═" * width
+    return f"\n{line}\n  {title}\n{line}"
+
+
+@lru_cache(maxsize=64)
+def format_subheader(title: str, width: int = 80) -> str:
+    """Format a subsection header."""
+    return f"\n─── {title} " + "─" * (width - len(title) - 5)
+
+
+def _is_utf8(encoding: str | None) -> bool:
+    """Whether an encoding name refers to UTF-8."""
+    try:
+        return codecs.lookup(encoding or "").name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _write_text(text: str, stream: TextIO):
+    """Write text straight to the stream's file descriptor when it is safe."""
+    # Bypassing the TextIOWrapper skips its encoding, error handler and
+    # newline translation, so the fast path is only taken for UTF-8 streams
+    # on platforms that need no translation, and for terminals only when
+    # TERM says they understand the ANSI colors. Anything else (StringIO,
+    # notebooks, Windows consoles, PYTHONIOENCODING) goes through write().
+    try:
+        fd = stream.fileno()
+        fast = (
+            _is_utf8(getattr(stream, "encoding", None))
+            and os.linesep == "\n"
+            and (not stream.isatty() or bool(os.environ.get("TERM")))
+        )
+    except (AttributeError, OSError, ValueError):
+        fast = False
+    if not fast:
+        stream.write(text)
+        return
+
+    stream.flush()
+    data = text.encode("utf-8", getattr(stream, "errors", None) or "strict")
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
 
 
-def print_header(title: str, width: int = 80):
-    """Print a section header."""
-    print()
-    print("═" * width)
-    print(f"  {title}")
-    print("═" * width)
+def _write_lines(lines: Iterable[str], out: TextIO | None):
+    """Write rendered lines to the output stream in ~64 KB chunks."""
+    stream = out or sys.stdout
+    chunk: list[str] = []
+    size = 0
 
+    for line in lines:
+        chunk.append(line)
+        chunk.append("\n")
+        size += len(line) + 1
+        if size >= _WRITE_CHUNK_SIZE:
+            _write_text("".join(chunk), stream)
+            chunk.clear()
+            size = 0
 
-def print_subheader(title: str, width: int = 80):
-    """Print a subsection header."""
-    print()
-    print(f"─── {title} " + "─" * (width - len(title) - 5))
+    if chunk:
+        _write_text("".join(chunk), stream)
 
 
-def print_analysis(analysis: TradeAnalysis):
+def print_analysis(analysis: TradeAnalysis, out: TextIO | None = None):
     """Print the full analysis dashboard."""
+    _write_lines(render_analysis(analysis), out)
+
+
+def print_portfolio_summary(
+    summary: PortfolioSummary,
+    username: str | None = None,
+    show_positions: bool = True,
+    out: TextIO | None = None,
+):
+    """Print a quick portfolio summary using the positions endpoint."""
+    _write_lines(render_portfolio_summary(summary, username, show_positions), out)
+
+
+def print_comparison(analyses: list[TradeAnalysis], out: TextIO | None = None):
+    """Print a comparison table of multiple wallets."""
+    _write_lines(render_comparison(analyses), out)
+
+
+def render_analysis(analysis: TradeAnalysis) -> Iterator[str]:
+    """Render the full analysis dashboard line by line."""
     profile = analysis.profile
     strategy = profile.strategy
 
     # Main header
-    print()
-    print("╔" + "═" * 78 + "╗")
-    print("║" + " POLYMARKET WALLET ANALYSIS ".center(78) + "║")
-    print("╚" + "═" * 78 + "╝")
+    yield ""
+    yield _ANALYSIS_BANNER
 
     # Wallet info
-    print_header("WALLET PROFILE")
-    print(f"  Address:    {profile.address}")
+    yield format_header("WALLET PROFILE")
+    yield f"  Address:    {profile.address}"
     if profile.username:
-        print(f"  Username:   @{profile.username}")
+        yield f"  Username:   @{profile.username}"
     if profile.first_trade_at:
-        print(f"  First Trade: {profile.first_trade_at.strftime('%Y-%m-%d')}")
-        print(
+        yield f"  First Trade: {profile.first_trade_at.strftime('%Y-%m-%d')}"
+        yield (
             f"  Last Trade:  {profile.last_trade_at.strftime('%Y-%m-%d') if profile.last_trade_at else 'N/A'}"
         )
-    print(f"  Active Days: {profile.active_days}")
+    yield f"  Active Days: {profile.active_days}"
 
     # Performance overview
-    print_header("PERFORMANCE OVERVIEW")
+    yield format_header("PERFORMANCE OVERVIEW")
 
-    pnl_color = "\033[92m" if profile.total_pnl >= 0 else "\033[91m"
-    reset = "\033[0m"
+    pnl_color = _GREEN if profile.total_pnl >= 0 else _RED
 
-    print(f"""
+    yield f"""
   ┌────────────────────────┬────────────────────────┬────────────────────────┐
   │   TOTAL P&L            │   TOTAL VOLUME         │   TOTAL TRADES         │
-  │   {pnl_color}{format_currency(profile.total_pnl):>18}{reset}   │   {format_large_number(profile.total_volume):>18}   │   {profile.total_trades:>18,}   │
+  │   {pnl_color}{format_currency(profile.total_pnl):>18}{_RESET}   │   {format_large_number(profile.total_volume):>18}   │   {profile.total_trades:>18,}   │
   └────────────────────────┴────────────────────────┴────────────────────────┘
-    """)
+    """
 
     # Key metrics
     roi = (
@@ -88,90 +236,86 @@ def print_analysis(analysis: TradeAnalysis):
         else 0
     )
 
-    print("  Key Metrics:")
-    print(
+    yield "  Key Metrics:"
+    yield (
         f"    Win Rate:        {profile.win_rate * 100:>6.1f}%  {create_bar(profile.win_rate, 1.0, 15)}"
     )
-    print(
+    yield (
         f"    Profit Factor:   {profile.profit_factor:>6.2f}x {'(excellent)' if profile.profit_factor > 2 else '(good)' if profile.profit_factor > 1.5 else ''}"
     )
-    print(f"    ROI:             {roi:>6.2f}%")
-    print(f"    Avg P&L/Trade:   {format_currency(profile.avg_profit_per_trade):>10}")
-    print(f"    Best Trade:      {format_currency(profile.best_trade_pnl):>10}")
-    print(f"    Worst Trade:     {format_currency(profile.worst_trade_pnl):>10}")
+    yield f"    ROI:             {roi:>6.2f}%"
+    yield f"    Avg P&L/Trade:   {format_currency(profile.avg_profit_per_trade):>10}"
+    yield f"    Best Trade:      {format_currency(profile.best_trade_pnl):>10}"
+    yield f"    Worst Trade:     {format_currency(profile.worst_trade_pnl):>10}"
     if profile.sharpe_ratio:
-        print(f"    Sharpe Ratio:    {profile.sharpe_ratio:>6.2f}")
+        yield f"    Sharpe Ratio:    {profile.sharpe_ratio:>6.2f}"
 
     # Strategy analysis
     if strategy:
-        print_header("STRATEGY ANALYSIS")
+        yield format_header("STRATEGY ANALYSIS")
 
-        print(f"""
+        yield f"""
   ┌─────────────────────────────────────────────────────────────────────────────┐
   │  Primary Strategy: {strategy.primary_strategy:<40} Confidence: {strategy.confidence * 100:.0f}%  │
   └─────────────────────────────────────────────────────────────────────────────┘
-        """)
+        """
 
-        print("  Characteristics:")
+        yield "  Characteristics:"
         for char in strategy.characteristics:
-            print(f"    • {char}")
+            yield f"    • {char}"
 
-        print_subheader("Trading Patterns")
-        print(f"    Trades/Day:      {strategy.trades_per_day:>8.1f}")
-        print(
-            f"    Avg Trade Size:  {format_currency(strategy.avg_trade_size_usd):>10}"
-        )
-        print(
+        yield format_subheader("Trading Patterns")
+        yield f"    Trades/Day:      {strategy.trades_per_day:>8.1f}"
+        yield f"    Avg Trade Size:  {format_currency(strategy.avg_trade_size_usd):>10}"
+        yield (
             f"    Median Trade:    {format_currency(strategy.median_trade_size_usd):>10}"
         )
-        print(f"    Max Position:    {format_currency(strategy.max_position_usd):>10}")
+        yield f"    Max Position:    {format_currency(strategy.max_position_usd):>10}"
         if strategy.avg_hold_time_hours:
             if strategy.avg_hold_time_hours < 1:
-                print(
+                yield (
                     f"    Avg Hold Time:   {strategy.avg_hold_time_hours * 60:>6.0f} minutes"
                 )
             elif strategy.avg_hold_time_hours < 24:
-                print(
-                    f"    Avg Hold Time:   {strategy.avg_hold_time_hours:>6.1f} hours"
-                )
+                yield f"    Avg Hold Time:   {strategy.avg_hold_time_hours:>6.1f} hours"
             else:
-                print(
+                yield (
                     f"    Avg Hold Time:   {strategy.avg_hold_time_hours / 24:>6.1f} days"
                 )
 
-        print_subheader("Market Preferences")
+        yield format_subheader("Market Preferences")
         if strategy.favorite_categories:
             total = sum(c for _, c in strategy.favorite_categories)
             for cat, count in strategy.favorite_categories[:4]:
                 pct = count / total * 100
                 bar = create_bar(count, total, 15)
-                print(f"    {cat:<12} {bar} {pct:>5.1f}% ({count:,} trades)")
+                yield f"    {cat:<12} {bar} {pct:>5.1f}% ({count:,} trades)"
 
-        print()
+        yield ""
         if strategy.prefers_favorites:
-            print("    Price Target: Prefers FAVORITES (high probability outcomes)")
+            yield "    Price Target: Prefers FAVORITES (high probability outcomes)"
         elif strategy.prefers_underdogs:
-            print("    Price Target: Prefers UNDERDOGS (low probability outcomes)")
+            yield "    Price Target: Prefers UNDERDOGS (low probability outcomes)"
         else:
-            print("    Price Target: Balanced (no strong preference)")
+            yield "    Price Target: Balanced (no strong preference)"
 
-        print_subheader("Timing Analysis")
-        print(
+        yield format_subheader("Timing Analysis")
+        yield (
             f"    Most Active Hours (UTC): {', '.join(f'{h:02d}:00' for h in strategy.most_active_hours)}"
         )
-        print(f"    Weekend Trader: {'Yes' if strategy.weekend_trader else 'No'}")
-        print(
+        yield f"    Weekend Trader: {'Yes' if strategy.weekend_trader else 'No'}"
+        yield (
             f"    Position Sizing: {'Consistent' if strategy.position_sizing_consistent else 'Variable'}"
         )
 
     # Top positions
     if profile.positions:
-        print_header("TOP POSITIONS (by P&L)")
-        print()
-        print(
+        yield format_header("TOP POSITIONS (by P&L)")
+        yield ""
+        yield (
             "    Market                                           Side     P&L        Trades"
         )
-        print("    " + "─" * 72)
+        yield _TABLE_RULE
 
         for i, pos in enumerate(profile.positions[:10]):
             market_name = (
@@ -179,12 +323,6 @@ def print_analysis(analysis: TradeAnalysis):
                 if len(pos.market_title) > 40
                 else pos.market_title
             )
-            pnl_str = format_currency(pos.realized_pnl)
-            if pos.realized_pnl >= 0:
-                pnl_str = f"\033[92m{pnl_str}\033[0m"
-            else:
-                pnl_str = f"\033[91m{pnl_str}\033[0m"
-
             net = (
                 "LONG"
                 if pos.net_position > 0
@@ -192,70 +330,74 @@ def print_analysis(analysis: TradeAnalysis):
                 if pos.net_position < 0
                 else "FLAT"
             )
-            print(f"    {market_name:<45} {net:<6} {pnl_str:>15}  {pos.trade_count:>5}")
+            yield _POSITION_ROW(
+                market=market_name,
+                side=net,
+                pnl=_colored_currency(pos.realized_pnl),
+                trades=pos.trade_count,
+            )
 
     # Anomalies and warnings
     if analysis.anomalies or analysis.warnings:
-        print_header("ALERTS & ANOMALIES")
+        yield format_header("ALERTS & ANOMALIES")
 
         if analysis.anomalies:
-            print()
-            print("  🚨 ANOMALIES DETECTED:")
+            yield ""
+            yield "  🚨 ANOMALIES DETECTED:"
             for anomaly in analysis.anomalies:
-                print(f"     ⚠️  {anomaly}")
+                yield f"     ⚠️  {anomaly}"
 
         if analysis.warnings:
-            print()
-            print("  ⚡ WARNINGS:")
+            yield ""
+            yield "  ⚡ WARNINGS:"
             for warning in analysis.warnings:
-                print(f"     •  {warning}")
+                yield f"     •  {warning}"
 
     # Footer
-    print()
-    print("─" * 80)
-    print(f"  Analysis generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("─" * 80)
-    print()
-
-
-def print_portfolio_summary(
-    summary: PortfolioSummary, username: str | None = None, show_positions: bool = True
-):
-    """Print a quick portfolio summary using the positions endpoint."""
+    yield ""
+    yield _DASH80
+    yield f"  Analysis generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    yield _DASH80
+    yield ""
+
+
+def render_portfolio_summary(
+    summary: PortfolioSummary,
+    username: str | None = None,
+    show_positions: bool = True,
+) -> Iterator[str]:
+    """Render a quick portfolio summary using the positions endpoint."""
     total_pnl = summary.unrealized_pnl + summary.realized_pnl
 
-    print()
-    print("╔" + "═" * 78 + "╗")
-    print("║" + " OPEN POSITIONS SUMMARY ".center(78) + "║")
-    print("╚" + "═" * 78 + "╝")
+    yield ""
+    yield _PORTFOLIO_BANNER
 
     # Wallet info
-    print()
-    print(f"  Address:    {summary.address}")
+    yield ""
+    yield f"  Address:    {summary.address}"
     if username:
-        print(f"  Username:   @{username}")
+        yield f"  Username:   @{username}"
 
     # Warning about limitations
-    print()
-    print(
-        "  \033[93mNOTE: This only shows OPEN positions. Closed/settled markets are excluded.\033[0m"
+    yield ""
+    yield (
+        f"  {_YELLOW}NOTE: This only shows OPEN positions. Closed/settled markets are excluded.{_RESET}"
     )
-    print("  \033[93mFor accurate all-time P&L, run without --quick flag.\033[0m")
+    yield f"  {_YELLOW}For accurate all-time P&L, run without --quick flag.{_RESET}"
 
     # Performance overview
-    pnl_color = "\033[92m" if total_pnl >= 0 else "\033[91m"
-    reset = "\033[0m"
+    pnl_color = _GREEN if total_pnl >= 0 else _RED
 
-    print(f"""
+    yield f"""
   ┌────────────────────────┬────────────────────────┬────────────────────────┐
   │   OPEN P&L             │   UNREALIZED           │   REALIZED (partial)   │
-  │   {pnl_color}{format_currency(total_pnl):>18}{reset}   │   {format_currency(summary.unrealized_pnl):>18}   │   {format_currency(summary.realized_pnl):>18}   │
+  │   {pnl_color}{format_currency(total_pnl):>18}{_RESET}   │   {format_currency(summary.unrealized_pnl):>18}   │   {format_currency(summary.realized_pnl):>18}   │
   └────────────────────────┴────────────────────────┴────────────────────────┘
-    """)
+    """
 
-    print(f"  Open Positions:  {summary.position_count:>10}")
-    print(f"  Current Value:   {format_currency(summary.total_value):>10}")
-    print(f"  Initial Value:   {format_currency(summary.total_initial_value):>10}")
+    yield f"  Open Positions:  {summary.position_count:>10}"
+    yield f"  Current Value:   {format_currency(summary.total_value):>10}"
+    yield f"  Initial Value:   {format_currency(summary.total_initial_value):>10}"
 
     # Top positions by P&L
     if show_positions and summary.positions:
@@ -264,13 +406,11 @@ def print_portfolio_summary(
             summary.positions, key=lambda p: p.cash_pnl + p.realized_pnl, reverse=True
         )
 
-        print()
-        print("─── Top Positions by P&L " + "─" * 53)
-        print()
-        print(
-            "    Market                                       Outcome   Value      P&L"
-        )
-        print("    " + "─" * 72)
+        yield ""
+        yield _TOP_POSITIONS_RULE
+        yield ""
+        yield "    Market                                       Outcome   Value      P&L"
+        yield _TABLE_RULE
 
         for pos in sorted_positions[:10]:
             market_name = (
@@ -278,67 +418,57 @@ def print_portfolio_summary(
                 if len(pos.market_title) > 38
                 else pos.market_title
             )
-            total_pos_pnl = pos.cash_pnl + pos.realized_pnl
-            pnl_str = format_currency(total_pos_pnl)
-            if total_pos_pnl >= 0:
-                pnl_str = f"\033[92m{pnl_str}\033[0m"
-            else:
-                pnl_str = f"\033[91m{pnl_str}\033[0m"
-
-            outcome_str = pos.outcome[:6] if pos.outcome else "?"
-            print(
-                f"    {market_name:<42} {outcome_str:<8} {format_currency(pos.current_value):>10} {pnl_str:>15}"
+            value = pos.current_value
+
+            yield _PORTFOLIO_ROW(
+                market=market_name,
+                outcome=pos.outcome[:6] if pos.outcome else "?",
+                # format_currency inlined for the per-row hot path
+                value=f"${value:,.2f}" if value >= 0 else f"-${-value:,.2f}",
+                pnl=_colored_currency(pos.cash_pnl + pos.realized_pnl),
             )
 
     # Footer
-    print()
-    print("─" * 80)
-    print(f"  Generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("─" * 80)
-    print()
+    yield ""
+    yield _DASH80
+    yield f"  Generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    yield _DASH80
+    yield ""
 
 
-def print_comparison(analyses: list[TradeAnalysis]):
-    """Print a comparison table of multiple wallets."""
+def render_comparison(analyses: list[TradeAnalysis]) -> Iterator[str]:
+    """Render a comparison table of multiple wallets."""
     if not analyses:
         return
 
-    print()
-    print("╔" + "═" * 98 + "╗")
-    print("║" + " WALLET COMPARISON ".center(98) + "║")
-    print("╚" + "═" * 98 + "╝")
-    print()
+    yield ""
+    yield _COMPARISON_BANNER
+    yield ""
 
     # Header row
-    print(
+    yield (
         f"  {'Wallet':<20} {'P&L':>14} {'Volume':>14} {'Win Rate':>10} {'ROI':>8} {'Trades':>10} {'Strategy':<20}"
     )
-    print("  " + "─" * 96)
+    yield _COMPARISON_RULE
 
-    for analysis in analyses:
-        p = analysis.profile
-        s = p.strategy
+    rows = map(_comparison_fields, (a.profile for a in analyses))
+    for pnl, volume, win_rate, trades, username, address, s in rows:
+        username = f"@{username}" if username else address[:12] + "..."
+        roi = (pnl / volume * 100) if volume > 0 else 0
+        strategy = getattr(s, "primary_strategy", "Unknown")[:18]
 
-        username = f"@{p.username}" if p.username else p.address[:12] + "..."
-        roi = (p.total_pnl / p.total_volume * 100) if p.total_volume > 0 else 0
-        strategy = s.primary_strategy[:18] if s else "Unknown"
-
-        pnl_str = format_large_number(p.total_pnl)
-        if p.total_pnl >= 0:
-            pnl_str = f"\033[92m{pnl_str}\033[0m"
-        else:
-            pnl_str = f"\033[91m{pnl_str}\033[0m"
+        pnl_str = _colored_large_number(pnl)
 
-        print(
-            f"  {username:<20} {pnl_str:>14} {format_large_number(p.total_volume):>14} {p.win_rate * 100:>9.1f}% {roi:>7.2f}% {p.total_trades:>10,} {strategy:<20}"
+        yield (
+            f"  {username:<20} {pnl_str:>14} {format_large_number(volume):>14} {win_rate * 100:>9.1f}% {roi:>7.2f}% {trades:>10,} {strategy:<20}"
         )
 
-    print()
+    yield ""
 
     # Anomaly summary
     any_anomalies = any(a.anomalies for a in analyses)
     if any_anomalies:
-        print("  ANOMALY SUMMARY:")
+        yield "  ANOMALY SUMMARY:"
         for analysis in analyses:
             if analysis.anomalies:
                 username = (
@@ -346,7 +476,7 @@ def print_comparison(analyses: list[TradeAnalysis]):
                     if analysis.profile.username
                     else analysis.profile.address[:12]
                 )
-                print(f"    {username}:")
+                yield f"    {username}:"
                 for anomaly in analysis.anomalies:
-                    print(f"      • {anomaly}")
-        print()
+                    yield f"      • {anomaly}"
+        yield ""
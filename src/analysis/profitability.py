@@ -1,19 +1,57 @@
 """Profitability analyzer for Polymarket wallets."""
 
+import asyncio
+import heapq
 import logging
-from collections import defaultdict
+import math
+import re
+import time
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from statistics import mean, median, stdev
+from functools import lru_cache
+from statistics import median
 
 import httpx
+import orjson
 
-logger = logging.getLogger(__name__)
+from ..api.data_api import parse_timestamp
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Market category by slug, checked in priority order: alternatives are tried
+# left to right at the start of the slug, and the name of the one that
+# matched is the category
+_CATEGORY_PATTERN = re.compile(
+    r"(?P<Sports>(?:nba|nfl|nhl)-)"
+    r"|(?=.*(?:president|election|trump|biden))(?P<Politics>)"
+    r"|(?=.*(?:crypto|bitcoin|eth|updown))(?P<Crypto>)",
+    re.DOTALL,
+)
+
+
+def _to_float(value) -> float:
+    """Coerce an API number (or numeric string) to float; 0.0 if missing/invalid."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not value:
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@lru_cache(maxsize=4096)
+def _market_category(slug: str) -> str:
+    """Classify a market slug as Sports, Politics, Crypto or Other."""
+    match = _CATEGORY_PATTERN.match(slug)
+    return match.lastgroup if match else "Other"
+
+
+@dataclass(slots=True)
 class TradeRecord:
-    """A single trade record."""
+    """A single trade record (slotted: large wallets hold tens of thousands)."""
 
     timestamp: datetime
     market_slug: str
@@ -27,7 +65,7 @@ class TradeRecord:
     asset: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketPosition:
     """Aggregated position in a market."""
 
@@ -118,13 +156,51 @@ class TradeAnalysis:
 class ProfitabilityAnalyzer:
     """Analyzes wallet trading history for profitability patterns."""
 
-    def __init__(self, data_api_base: str = "https://data-api.polymarket.com"):
+    PAGE_SIZE = 500  # max rows per /activity request
+    PAGE_CONCURRENCY = 8  # pages requested at once after the first
+    TRADE_CACHE_SIZE = 64  # fetched trade histories kept in memory
+
+    def __init__(
+        self,
+        data_api_base: str = "https://data-api.polymarket.com",
+        cache_ttl_seconds: float | None = None,
+    ):
+        """
+        Args:
+            data_api_base: Base URL of the Polymarket Data API
+            cache_ttl_seconds: How long fetched trade histories are reused
+                (None = for the lifetime of the analyzer)
+        """
         self.data_api_base = data_api_base.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=60.0)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # (address, start, end, max_trades) -> (expiry, trades), in LRU order
+        self._trade_cache: OrderedDict[tuple, tuple[float, list[TradeRecord]]] = (
+            OrderedDict()
+        )
+        # Pool and HTTP/2 settings live on the transport: the client ignores
+        # its own limits/http2 arguments when a transport is supplied
+        self._client = httpx.AsyncClient(
+            timeout=60.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=30.0,
+                ),
+                retries=2,
+            ),
+        )
 
     async def close(self):
         await self._client.aclose()
 
+    async def __aenter__(self) -> "ProfitabilityAnalyzer":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
     async def analyze_wallet(
         self,
         address: str,
@@ -185,7 +261,7 @@ class ProfitabilityAnalyzer:
         profile = self._calculate_profile(address, username, trades, positions)
 
         # Detect strategy patterns
-        profile.strategy = self._detect_strategy(trades, positions)
+        profile.strategy = self._detect_strategy(trades, positions, profile)
 
         # Generate warnings and anomalies
         warnings, anomalies = self._detect_anomalies(profile, trades)
@@ -196,6 +272,37 @@ class ProfitabilityAnalyzer:
             anomalies=anomalies,
         )
 
+    async def analyze_many(
+        self,
+        addresses: list[str],
+        concurrency: int = 8,
+        max_trades: int | None = None,
+        start_timestamp: int | None = None,
+        end_timestamp: int | None = None,
+    ) -> list[TradeAnalysis]:
+        """
+        Analyze several wallets concurrently.
+
+        At most ``concurrency`` wallets are analyzed at once. They all share
+        this analyzer's pooled HTTP/2 client, so their requests are
+        multiplexed over the same connections.
+
+        Returns:
+            One TradeAnalysis per address, in the order given
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def analyze_one(address: str) -> TradeAnalysis:
+            async with semaphore:
+                return await self.analyze_wallet(
+                    address,
+                    max_trades=max_trades,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
+
+        return await asyncio.gather(*(analyze_one(a) for a in addresses))
+
     async def _fetch_all_trades(
         self,
         address: str,
@@ -203,108 +310,210 @@ class ProfitabilityAnalyzer:
         start_timestamp: int | None = None,
         end_timestamp: int | None = None,
     ) -> list[TradeRecord]:
-        """Fetch trades for a wallet with pagination."""
-        trades = []
-        offset = 0
-        limit = 500
+        """
+        Fetch trades for a wallet, reusing a cached result for the same query.
+
+        The returned list is a copy; the TradeRecords themselves are shared
+        with the cache and must not be modified.
+        """
+        key = (address, start_timestamp, end_timestamp, max_trades)
+        cached = self._trade_cache.get(key)
+        if cached is not None:
+            expiry, trades = cached
+            if time.monotonic() < expiry:
+                self._trade_cache.move_to_end(key)
+                return list(trades)
+            del self._trade_cache[key]
+
+        trades = await self._fetch_trade_pages(
+            address, max_trades, start_timestamp, end_timestamp
+        )
+
+        expiry = (
+            time.monotonic() + self.cache_ttl_seconds
+            if self.cache_ttl_seconds is not None
+            else float("inf")
+        )
+        self._trade_cache[key] = (expiry, trades)
+        if len(self._trade_cache) > self.TRADE_CACHE_SIZE:
+            self._trade_cache.popitem(last=False)
+
+        return list(trades)
+
+    async def _fetch_trade_pages(
+        self,
+        address: str,
+        max_trades: int | None,
+        start_timestamp: int | None,
+        end_timestamp: int | None,
+    ) -> list[TradeRecord]:
+        """
+        Fetch trades for a wallet with pagination.
 
+        The first page is fetched on its own; if it is full, the following
+        pages are requested PAGE_CONCURRENCY at a time and concatenated in
+        offset order, stopping at the first short (or failed) page.
+        """
+        limit = self.PAGE_SIZE
+        params = {
+            "user": address,
+            "limit": limit,
+            "type": "TRADE",
+            "sortBy": "TIMESTAMP",
+            "sortDirection": "DESC",
+        }
+
+        if start_timestamp:
+            params["start"] = start_timestamp
+        if end_timestamp:
+            params["end"] = end_timestamp
+
+        titles: dict[str, str] = {}
+        received, trades = await self._fetch_page(params, 0, titles)
+        if received < limit:
+            return trades
+
+        offset = limit
         while max_trades is None or len(trades) < max_trades:
-            params = {
-                "user": address,
-                "limit": limit,
-                "offset": offset,
-                "type": "TRADE",
-                "sortBy": "TIMESTAMP",
-                "sortDirection": "DESC",
-            }
-
-            if start_timestamp:
-                params["start"] = start_timestamp
-            if end_timestamp:
-                params["end"] = end_timestamp
+            logger.debug(f"Fetched {len(trades)} trades so far")
 
-            try:
-                response = await self._client.get(
-                    f"{self.data_api_base}/activity",
-                    params=params,
+            pages_wanted = self.PAGE_CONCURRENCY
+            if max_trades is not None:
+                pages_wanted = min(
+                    pages_wanted, -(-(max_trades - len(trades)) // limit)
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                if not data:
-                    break
-
-                for item in data:
-                    try:
-                        ts = item.get("timestamp")
-                        if not ts:
-                            continue
-                        # Handle both Unix timestamp (int) and ISO string
-                        if isinstance(ts, (int, float)):
-                            timestamp = datetime.fromtimestamp(ts)
-                        else:
-                            timestamp = datetime.fromisoformat(
-                                str(ts).replace("Z", "+00:00")
-                            )
-
-                        trade = TradeRecord(
-                            timestamp=timestamp,
-                            market_slug=item.get("slug", ""),
-                            market_title=item.get("title", "Unknown"),
-                            outcome=item.get("outcome", ""),
-                            side=item.get("side", ""),
-                            size=float(item.get("size", 0)),
-                            price=float(item.get("price", 0))
-                            if item.get("price")
-                            else 0,
-                            usd_size=float(item.get("usdcSize", 0)),
-                            transaction_hash=item.get("transactionHash", ""),
-                            asset=item.get("asset", ""),
-                        )
-                        trades.append(trade)
-                    except Exception as e:
-                        logger.debug(f"Error parsing trade: {e}")
+            offsets = [offset + i * limit for i in range(pages_wanted)]
+
+            tasks = [
+                asyncio.create_task(self._fetch_page(params, page_offset, titles))
+                for page_offset in offsets
+            ]
+            # Pages are parsed as their responses arrive; the first short page
+            # marks the end of the history, so requests past it are cancelled
+            last_page = len(tasks) - 1
+            try:
+                async for task in asyncio.as_completed(tasks):
+                    if task.cancelled():
                         continue
+                    received, _ = task.result()
+                    index = tasks.index(task)
+                    if received < limit and index < last_page:
+                        last_page = index
+                        for later in tasks[index + 1 :]:
+                            later.cancel()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            for task in tasks[: last_page + 1]:
+                received, page = task.result()
+                trades.extend(page)
+                if received < limit:
+                    return trades
+
+            offset += pages_wanted * limit
 
-                if len(data) < limit:
-                    break
+        return trades
 
-                offset += limit
-                print(f"  Fetched {len(trades)} trades...", flush=True)
+    async def _fetch_page(
+        self, params: dict, offset: int, titles: dict[str, str]
+    ) -> tuple[int, list[TradeRecord]]:
+        """
+        Fetch and parse one page of trades.
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"API error fetching trades: {e}")
-                break
+        ``titles`` maps market slug to title and is shared by all pages of a
+        fetch, so every trade in a market references one title string.
 
-        return trades
+        Returns:
+            (number of rows the API returned, parsed trades). An API error is
+            reported as an empty page so pagination stops there.
+        """
+        try:
+            response = await self._client.get(
+                f"{self.data_api_base}/activity",
+                params={**params, "offset": offset},
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"API error fetching trades: {e}")
+            return 0, []
+
+        data = orjson.loads(response.content)
+        if not data:
+            return 0, []
+        if not isinstance(data, list):
+            logger.error(f"Unexpected trades response: {data!r:.200}")
+            return 0, []
+
+        # Rows that are not objects are skipped rather than failing the page
+        trades = [
+            TradeRecord(
+                timestamp=timestamp,
+                market_slug=item.get("slug", ""),
+                market_title=titles.setdefault(
+                    item.get("slug", ""), item.get("title", "Unknown")
+                ),
+                outcome=item.get("outcome", ""),
+                side=item.get("side", ""),
+                size=_to_float(item.get("size")),
+                price=_to_float(item.get("price")),
+                usd_size=_to_float(item.get("usdcSize")),
+                transaction_hash=item.get("transactionHash", ""),
+                asset=item.get("asset", ""),
+            )
+            for item in data
+            if isinstance(item, dict)
+            and (timestamp := parse_timestamp(item.get("timestamp"))) is not None
+        ]
+
+        return len(data), trades
 
     def _build_positions(self, trades: list[TradeRecord]) -> list[MarketPosition]:
-        """Aggregate trades into market positions."""
-        # Group by market and outcome
-        position_map: dict[tuple[str, str], list[TradeRecord]] = defaultdict(list)
+        """
+        Aggregate trades into market positions.
+
+        Positions are returned unsorted; only the profile's top positions
+        are ever shown, so _calculate_profile selects those itself.
+        """
+        # One pass over the trades, accumulating per (market, outcome):
+        # [bought, buy notional, sold, sell notional, count, first, last, title]
+        totals: dict[tuple[str, str], list] = {}
 
         for trade in trades:
             key = (trade.market_slug, trade.outcome)
-            position_map[key].append(trade)
+            ts = trade.timestamp
+            acc = totals.get(key)
+            if acc is None:
+                acc = totals[key] = [0.0, 0.0, 0.0, 0.0, 0, ts, ts, trade.market_title]
+            side = trade.side
+            if side == "BUY":
+                size = trade.size
+                acc[0] += size
+                acc[1] += trade.price * size
+            elif side == "SELL":
+                size = trade.size
+                acc[2] += size
+                acc[3] += trade.price * size
+            acc[4] += 1
+            if ts < acc[5]:
+                acc[5] = ts
+            elif ts > acc[6]:
+                acc[6] = ts
 
         positions = []
-        for (market_slug, outcome), market_trades in position_map.items():
-            buys = [t for t in market_trades if t.side == "BUY"]
-            sells = [t for t in market_trades if t.side == "SELL"]
-
-            total_bought = sum(t.size for t in buys)
-            total_sold = sum(t.size for t in sells)
-
-            avg_buy_price = (
-                sum(t.price * t.size for t in buys) / total_bought
-                if total_bought > 0
-                else 0
-            )
-            avg_sell_price = (
-                sum(t.price * t.size for t in sells) / total_sold
-                if total_sold > 0
-                else 0
-            )
+        for (market_slug, outcome), (
+            total_bought,
+            buy_notional,
+            total_sold,
+            sell_notional,
+            trade_count,
+            first_trade,
+            last_trade,
+            market_title,
+        ) in totals.items():
+            avg_buy_price = buy_notional / total_bought if total_bought > 0 else 0
+            avg_sell_price = sell_notional / total_sold if total_sold > 0 else 0
 
             # Realized P&L from round trips
             matched_size = min(total_bought, total_sold)
@@ -317,7 +526,7 @@ class ProfitabilityAnalyzer:
             positions.append(
                 MarketPosition(
                     market_slug=market_slug,
-                    market_title=market_trades[0].market_title,
+                    market_title=market_title,
                     outcome=outcome,
                     total_bought=total_bought,
                     total_sold=total_sold,
@@ -325,13 +534,13 @@ class ProfitabilityAnalyzer:
                     avg_sell_price=avg_sell_price,
                     net_position=total_bought - total_sold,
                     realized_pnl=realized_pnl,
-                    trade_count=len(market_trades),
-                    first_trade=min(t.timestamp for t in market_trades),
-                    last_trade=max(t.timestamp for t in market_trades),
+                    trade_count=trade_count,
+                    first_trade=first_trade,
+                    last_trade=last_trade,
                 )
             )
 
-        return sorted(positions, key=lambda p: abs(p.realized_pnl), reverse=True)
+        return positions
 
     def _calculate_profile(
         self,
@@ -341,48 +550,71 @@ class ProfitabilityAnalyzer:
         positions: list[MarketPosition],
     ) -> WalletProfile:
         """Calculate overall wallet profile metrics."""
-        total_volume = sum(t.usd_size for t in trades)
-
-        # Calculate P&L from positions
-        total_realized_pnl = sum(p.realized_pnl for p in positions)
-
-        # Win/loss tracking
-        winning_positions = [p for p in positions if p.realized_pnl > 0]
-        losing_positions = [p for p in positions if p.realized_pnl < 0]
-
-        gross_profit = sum(p.realized_pnl for p in winning_positions)
-        gross_loss = abs(sum(p.realized_pnl for p in losing_positions))
-
-        win_rate = len(winning_positions) / len(positions) if positions else 0
+        # Single pass over positions; per-trade P&L mean and variance are
+        # accumulated with Welford's algorithm
+        total_realized_pnl = 0.0
+        gross_profit = 0.0
+        gross_loss = 0.0
+        winners = 0
+        best_trade = worst_trade = 0
+        n = 0
+        pnl_mean = 0.0
+        pnl_m2 = 0.0
+        for i, p in enumerate(positions):
+            pnl = p.realized_pnl
+            total_realized_pnl += pnl
+            if pnl > 0:
+                gross_profit += pnl
+                winners += 1
+            elif pnl < 0:
+                gross_loss -= pnl
+
+            if i == 0:
+                best_trade = worst_trade = pnl
+            elif pnl > best_trade:
+                best_trade = pnl
+            elif pnl < worst_trade:
+                worst_trade = pnl
+
+            if p.trade_count > 0:
+                n += 1
+                delta = pnl / p.trade_count - pnl_mean
+                pnl_mean += delta / n
+                pnl_m2 += delta * (pnl / p.trade_count - pnl_mean)
+
+        win_rate = winners / len(positions) if positions else 0
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float("inf")
 
         # Trade-level stats
-        pnl_per_trade = [
-            p.realized_pnl / p.trade_count for p in positions if p.trade_count > 0
-        ]
-        avg_profit_per_trade = mean(pnl_per_trade) if pnl_per_trade else 0
-
-        best_trade = max((p.realized_pnl for p in positions), default=0)
-        worst_trade = min((p.realized_pnl for p in positions), default=0)
+        avg_profit_per_trade = pnl_mean if n else 0
 
         # Sharpe ratio approximation
-        if len(pnl_per_trade) > 1:
-            try:
-                returns_std = stdev(pnl_per_trade)
-                sharpe_ratio = (
-                    (avg_profit_per_trade / returns_std) if returns_std > 0 else None
-                )
-            except:
-                sharpe_ratio = None
-        else:
-            sharpe_ratio = None
-
-        # Time analysis
-        timestamps = [t.timestamp for t in trades]
-        first_trade = min(timestamps) if timestamps else None
-        last_trade = max(timestamps) if timestamps else None
-
-        unique_days = len(set(t.timestamp.date() for t in trades))
+        sharpe_ratio = None
+        if n > 1 and pnl_m2 > 0:
+            sharpe_ratio = avg_profit_per_trade / math.sqrt(pnl_m2 / (n - 1))
+
+        # Volume and time analysis in one pass over trades
+        total_volume = 0.0
+        first_trade = last_trade = None
+        # Days are counted by ordinal rather than date() objects; trades
+        # arrive sorted, so the set only sees each day once
+        days = set()
+        last_day = None
+        for t in trades:
+            total_volume += t.usd_size
+            ts = t.timestamp
+            if first_trade is None:
+                first_trade = last_trade = ts
+            elif ts < first_trade:
+                first_trade = ts
+            elif ts > last_trade:
+                last_trade = ts
+            day = ts.toordinal()
+            if day != last_day:
+                days.add(day)
+                last_day = day
+
+        unique_days = len(days)
 
         return WalletProfile(
             address=address,
@@ -399,56 +631,65 @@ class ProfitabilityAnalyzer:
             first_trade_at=first_trade,
             last_trade_at=last_trade,
             active_days=unique_days,
-            positions=positions[:50],  # Top 50 positions
+            # Top 50 positions by |P&L|, without sorting them all
+            positions=heapq.nlargest(50, positions, key=lambda p: abs(p.realized_pnl)),
         )
 
     def _detect_strategy(
         self,
         trades: list[TradeRecord],
         positions: list[MarketPosition],
+        profile: WalletProfile,
     ) -> StrategyInsights:
-        """Detect trading strategy patterns."""
+        """
+        Detect trading strategy patterns.
+
+        Date range, active days and win rate are taken from the already
+        calculated profile rather than recomputed from the trades.
+        """
 
         # Trade sizing analysis
         trade_sizes = [t.usd_size for t in trades]
-        avg_trade_size = mean(trade_sizes) if trade_sizes else 0
+        # math.fsum is exact enough here and far cheaper than statistics.mean
+        avg_trade_size = math.fsum(trade_sizes) / len(trade_sizes) if trade_sizes else 0
         median_trade_size = median(trade_sizes) if trade_sizes else 0
         max_trade_size = max(trade_sizes) if trade_sizes else 0
 
         # Position sizing consistency
         if len(trade_sizes) > 1:
-            try:
-                size_cv = (
-                    stdev(trade_sizes) / mean(trade_sizes)
-                    if mean(trade_sizes) > 0
-                    else 0
-                )
-                position_sizing_consistent = (
-                    size_cv < 1.0
-                )  # CV < 1 means relatively consistent
-            except:
-                position_sizing_consistent = False
+            size_stdev = math.sqrt(
+                math.fsum((x - avg_trade_size) ** 2 for x in trade_sizes)
+                / (len(trade_sizes) - 1)
+            )
+            size_cv = size_stdev / avg_trade_size if avg_trade_size > 0 else 0
+            # CV < 1 means relatively consistent
+            position_sizing_consistent = size_cv < 1.0
         else:
             position_sizing_consistent = True
 
-        # Timing analysis
-        hours = [t.timestamp.hour for t in trades]
+        # Timing analysis; buy prices for the price preference below are
+        # tallied in the same pass
         hour_counts = defaultdict(int)
-        for h in hours:
-            hour_counts[h] += 1
+        weekend_trades = 0
+        buy_price_total = 0.0
+        buy_count = 0
+        for t in trades:
+            ts = t.timestamp
+            hour_counts[ts.hour] += 1
+            if ts.weekday() >= 5:
+                weekend_trades += 1
+            if t.side == "BUY" and t.price > 0:
+                buy_price_total += t.price
+                buy_count += 1
         most_active_hours = sorted(
-            hour_counts.keys(), key=lambda h: hour_counts[h], reverse=True
+            hour_counts.keys(), key=hour_counts.__getitem__, reverse=True
         )[:3]
 
-        weekdays = [t.timestamp.weekday() for t in trades]
-        weekend_trades = sum(1 for w in weekdays if w >= 5)
         weekend_trader = weekend_trades / len(trades) > 0.3 if trades else False
 
         # Trades per day
         if trades:
-            date_range = (
-                max(t.timestamp for t in trades) - min(t.timestamp for t in trades)
-            ).days + 1
+            date_range = (profile.last_trade_at - profile.first_trade_at).days + 1
             trades_per_day = len(trades) / date_range if date_range > 0 else len(trades)
         else:
             trades_per_day = 0
@@ -456,39 +697,15 @@ class ProfitabilityAnalyzer:
         # Market category preferences
         category_counts = defaultdict(int)
         for trade in trades:
-            # Extract category from slug
-            slug = trade.market_slug
-            if (
-                slug.startswith("nba-")
-                or slug.startswith("nfl-")
-                or slug.startswith("nhl-")
-            ):
-                category_counts["Sports"] += 1
-            elif (
-                "president" in slug
-                or "election" in slug
-                or "trump" in slug
-                or "biden" in slug
-            ):
-                category_counts["Politics"] += 1
-            elif (
-                "crypto" in slug
-                or "bitcoin" in slug
-                or "eth" in slug
-                or "updown" in slug
-            ):
-                category_counts["Crypto"] += 1
-            else:
-                category_counts["Other"] += 1
+            category_counts[_market_category(trade.market_slug)] += 1
 
         favorite_categories = sorted(
             category_counts.items(), key=lambda x: x[1], reverse=True
         )
 
         # Price preference (favorites vs underdogs)
-        buy_prices = [t.price for t in trades if t.side == "BUY" and t.price > 0]
-        if buy_prices:
-            avg_buy_price = mean(buy_prices)
+        if buy_count:
+            avg_buy_price = buy_price_total / buy_count
             prefers_favorites = avg_buy_price > 0.6
             prefers_underdogs = avg_buy_price < 0.4
         else:
@@ -501,7 +718,7 @@ class ProfitabilityAnalyzer:
             if pos.total_bought > 0 and pos.total_sold > 0:
                 hold_time = (pos.last_trade - pos.first_trade).total_seconds() / 3600
                 hold_times.append(hold_time)
-        avg_hold_time = mean(hold_times) if hold_times else None
+        avg_hold_time = math.fsum(hold_times) / len(hold_times) if hold_times else None
 
         # Strategy classification
         strategy, confidence, characteristics = self._classify_strategy(
@@ -512,9 +729,7 @@ class ProfitabilityAnalyzer:
             favorite_categories=favorite_categories,
             prefers_favorites=prefers_favorites,
             prefers_underdogs=prefers_underdogs,
-            win_rate=len([p for p in positions if p.realized_pnl > 0]) / len(positions)
-            if positions
-            else 0,
+            win_rate=profile.win_rate,
         )
 
         return StrategyInsights(
@@ -532,8 +747,7 @@ class ProfitabilityAnalyzer:
             weekend_trader=weekend_trader,
             position_sizing_consistent=position_sizing_consistent,
             max_position_usd=max_trade_size,
-            avg_positions_concurrent=len(positions)
-            / max(1, len(set(t.timestamp.date() for t in trades))),
+            avg_positions_concurrent=len(positions) / max(1, profile.active_days),
         )
 
     def _classify_strategy(
@@ -5,10 +5,16 @@ import asyncio
 import logging
 import re
 import sys
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 
 import httpx
 
+try:
+    import uvloop
+except ImportError:  # optional, installed with the "fast" extra
+    uvloop = None
+
 from .analysis.dashboard import (
     print_analysis,
     print_comparison,
@@ -16,6 +22,15 @@ from .analysis.dashboard import (
 )
 from .analysis.profitability import ProfitabilityAnalyzer
 from .api.data_api import DataApiClient
+from .db import Repository
+
+# Wallets fetched from the API at once
+MAX_CONCURRENCY = 8
+
+_PROFILE_URL_PATTERN = re.compile(r"polymarket\.com/@([\w-]+)")
+
+# Shared client for profile lookups, created on first use
+_PROFILE_CLIENT: httpx.AsyncClient | None = None
 
 # Known wallet mappings (username -> address)
 KNOWN_WALLETS = {
@@ -24,8 +39,34 @@ KNOWN_WALLETS = {
     "Account88888": "0x7f69983eb28245bba0d5083502a78744a8f66162",
 }
 
+# Usernames are matched case-insensitively
+_KNOWN_WALLETS_BY_NAME = {name.lower(): addr for name, addr in KNOWN_WALLETS.items()}
+
+
+def _get_profile_client() -> httpx.AsyncClient:
+    """Return the shared profile client, creating it if needed."""
+    global _PROFILE_CLIENT
+    if _PROFILE_CLIENT is None:
+        _PROFILE_CLIENT = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            http2=True,
+        )
+    return _PROFILE_CLIENT
+
+
+async def _close_profile_client():
+    """Close the shared profile client if it was created."""
+    global _PROFILE_CLIENT
+    if _PROFILE_CLIENT is not None:
+        await _PROFILE_CLIENT.aclose()
+        _PROFILE_CLIENT = None
 
-async def resolve_wallet(identifier: str) -> tuple[str, str | None]:
+
+async def resolve_wallet(
+    identifier: str,
+    open_repository: Callable[[], Awaitable[Repository]] | None = None,
+) -> tuple[str, str | None]:
     """
     Resolve a wallet identifier to an address.
 
@@ -34,8 +75,17 @@ async def resolve_wallet(identifier: str) -> tuple[str, str | None]:
     - @username
     - https://polymarket.com/@username URL
 
+    Usernames looked up through the Polymarket API are cached in the
+    repository returned by ``open_repository`` (when given) so later runs
+    skip the request. It is only called for usernames that are not known
+    wallets.
+
     Returns:
         (address, username) tuple
+
+    Raises:
+        ValueError: The identifier is malformed or the username is unknown
+        ConnectionError: The profiles API could not be reached
     """
     # Already an address
     if identifier.startswith("0x") and len(identifier) == 42:
@@ -44,7 +94,7 @@ async def resolve_wallet(identifier: str) -> tuple[str, str | None]:
     # Extract username from URL or @mention
     username = None
     if "polymarket.com/@" in identifier:
-        match = re.search(r"polymarket\.com/@([\w-]+)", identifier)
+        match = _PROFILE_URL_PATTERN.search(identifier)
         if match:
             username = match.group(1)
     elif identifier.startswith("@"):
@@ -56,28 +106,75 @@ async def resolve_wallet(identifier: str) -> tuple[str, str | None]:
         raise ValueError(f"Could not parse identifier: {identifier}")
 
     # Check known wallets first
-    if username in KNOWN_WALLETS:
-        return KNOWN_WALLETS[username], username
+    address = _KNOWN_WALLETS_BY_NAME.get(username.lower())
+    if address:
+        return address, username
+
+    # Then usernames resolved on earlier runs
+    repository = await open_repository() if open_repository else None
+    if repository:
+        address = await repository.get_address_for_username(username)
+        if address:
+            return address, username
 
     # Try to fetch from Polymarket API
-    async with httpx.AsyncClient() as client:
-        try:
-            # Try the profiles API
-            response = await client.get(
-                f"https://polymarket.com/api/profile/{username}",
-                follow_redirects=True,
-                timeout=10.0,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if "proxyWallet" in data:
-                    return data["proxyWallet"].lower(), username
-                if "address" in data:
-                    return data["address"].lower(), username
-        except Exception as e:
-            logging.debug(f"Could not fetch profile for {username}: {e}")
+    address = await _fetch_profile_address(username)
+    if not address:
+        raise ValueError(f"Could not resolve wallet address for: {username}")
+
+    if repository:
+        await repository.cache_username(username, address)
+    return address, username
+
+
+async def _fetch_profile_address(username: str) -> str | None:
+    """
+    Look up a username's wallet address with the Polymarket profiles API.
+
+    Returns None when the API has no address for the username; network
+    failures and timeouts raise ConnectionError instead.
+    """
+    client = _get_profile_client()
+    try:
+        response = await client.get(
+            f"https://polymarket.com/api/profile/{username}",
+            follow_redirects=True,
+        )
+    except httpx.HTTPError as e:
+        raise ConnectionError(
+            f"Could not reach Polymarket to resolve {username}: {e!r}"
+        ) from e
 
-    raise ValueError(f"Could not resolve wallet address for: {username}")
+    if response.status_code != 200:
+        return None
+    try:
+        data = response.json()
+    except ValueError as e:
+        logging.debug(f"Could not parse profile for {username}: {e}")
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    address = data["proxyWallet"] if "proxyWallet" in data else data.get("address")
+    if not isinstance(address, str) or not address:
+        return None
+    return address.lower()
+
+
+async def _bounded(semaphore: asyncio.Semaphore, coro):
+    """Await a coroutine while holding a slot of the semaphore."""
+    async with semaphore:
+        return await coro
+
+
+async def _print_as_completed(tasks: list[asyncio.Task], printer):
+    """Print each task's result as soon as it finishes."""
+    try:
+        async for task in asyncio.as_completed(tasks):
+            printer(await task)
+    finally:
+        for task in tasks:
+            task.cancel()
 
 
 async def main_async(args):
@@ -94,30 +191,84 @@ async def main_async(args):
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
-    # Resolve wallet addresses
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    # Resolve wallet addresses. The watcher database is only opened if a
+    # username has to be looked up, so address-only runs never touch it.
+    repository: Repository | None = None
+    repository_lock = asyncio.Lock()
+
+    async def open_repository() -> Repository:
+        nonlocal repository
+        async with repository_lock:
+            if repository is None:
+                opened = Repository(args.db, reader_count=0)
+                await opened.initialize()
+                repository = opened
+        return repository
+
+    try:
+        results = await asyncio.gather(
+            *(
+                _bounded(semaphore, resolve_wallet(i, open_repository))
+                for i in args.wallets
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await _close_profile_client()
+        if repository is not None:
+            await repository.close()
     wallets = []
-    for identifier in args.wallets:
-        try:
-            address, username = await resolve_wallet(identifier)
-            wallets.append((address, username))
-            logging.info(
-                f"Resolved {identifier} -> {address[:10]}... ({username or 'no username'})"
-            )
-        except ValueError as e:
-            logging.error(str(e))
-            sys.exit(1)
+    failed = False
+    for identifier, result in zip(args.wallets, results):
+        if isinstance(result, ValueError):
+            logging.error(str(result))
+            failed = True
+            continue
+        if isinstance(result, ConnectionError):
+            # Transient; analyze the wallets that did resolve
+            logging.warning(str(result))
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        address, username = result
+        wallets.append((address, username))
+        logging.info(
+            f"Resolved {identifier} -> {address[:10]}... ({username or 'no username'})"
+        )
+    if failed or not wallets:
+        sys.exit(1)
 
     # Quick mode uses positions endpoint for fast aggregate stats
     if args.quick:
         data_client = DataApiClient()
         try:
-            for address, username in wallets:
-                print(
-                    f"\nFetching portfolio summary for {username or address[:10]}...",
-                    flush=True,
+            print(
+                f"\nFetching portfolio summaries for {len(wallets)} wallet(s)...",
+                flush=True,
+            )
+            # --compare keeps command-line order
+            if args.compare:
+                summaries = await data_client.get_portfolio_summaries(
+                    [address for address, _ in wallets]
                 )
-                summary = await data_client.get_portfolio_summary(address)
-                print_portfolio_summary(summary, username)
+                for (_, username), summary in zip(wallets, summaries):
+                    print_portfolio_summary(summary, username)
+                return
+
+            usernames = {address: username for address, username in wallets}
+            await _print_as_completed(
+                [
+                    asyncio.create_task(
+                        _bounded(semaphore, data_client.get_portfolio_summary(address))
+                    )
+                    for address, _ in wallets
+                ],
+                lambda summary: print_portfolio_summary(
+                    summary, usernames[summary.address]
+                ),
+            )
         finally:
             await data_client.close()
         return
@@ -135,22 +286,31 @@ async def main_async(args):
         print(f"Filtering trades from today ({today_start.strftime('%Y-%m-%d')} UTC)")
 
     try:
-        analyses = []
-
-        for address, username in wallets:
-            print(f"\nAnalyzing {username or address[:10]}...", flush=True)
-            analysis = await analyzer.analyze_wallet(
-                address,
-                username,
-                max_trades=args.max_trades,
-                start_timestamp=start_timestamp,
+        print(f"\nAnalyzing {len(wallets)} wallet(s)...", flush=True)
+        analyses = [
+            _bounded(
+                semaphore,
+                analyzer.analyze_wallet(
+                    address,
+                    username,
+                    max_trades=args.max_trades,
+                    start_timestamp=start_timestamp,
+                ),
             )
-            analyses.append(analysis)
+            for address, username in wallets
+        ]
+
+        # Without a comparison table there is nothing to wait for, so show
+        # each wallet as soon as its analysis is done
+        if not args.compare:
+            await _print_as_completed(
+                [asyncio.create_task(a) for a in analyses], print_analysis
+            )
+            return
 
-            if not args.compare:
-                print_analysis(analysis)
+        analyses = await asyncio.gather(*analyses)
 
-        if args.compare and len(analyses) > 1:
+        if len(analyses) > 1:
             print_comparison(analyses)
 
             # Also print individual analyses if verbose
@@ -237,10 +397,19 @@ Examples:
         help="Quick mode: show portfolio summary using positions endpoint (much faster)",
     )
 
+    parser.add_argument(
+        "--db",
+        default="data/polymarket_watcher.db",
+        help="SQLite database used to cache username lookups",
+    )
+
     args = parser.parse_args()
 
     try:
-        asyncio.run(main_async(args))
+        asyncio.run(
+            main_async(args),
+            loop_factory=uvloop.new_event_loop if uvloop else None,
+        )
     except KeyboardInterrupt:
         print("\nAnalysis interrupted.")
         sys.exit(0)
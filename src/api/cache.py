@@ -0,0 +1,50 @@
+"""Small in-memory cache shared by the API clients."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class LRUTTLCache:
+    """
+    Size-bounded LRU cache whose entries expire after a fixed TTL.
+
+    Expired entries are dropped lazily when they are looked up; the least
+    recently used entry is evicted once the cache grows past ``max_size``.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 3600.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if time.monotonic() >= expiry:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        """Drop a cached entry, if present."""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
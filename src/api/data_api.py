@@ -1,12 +1,40 @@
 """Client for Polymarket Data API - fetches wallet activity and history."""
 
+import asyncio
+import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 import httpx
+import orjson
 
+from .cache import LRUTTLCache
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+def parse_timestamp(ts) -> datetime | None:
+    """
+    Parse a Unix or ISO 8601 Data API timestamp as an aware UTC datetime.
+
+    Returns None when the timestamp is missing or malformed.
+    """
+    if not ts:
+        return None
+    # fromisoformat accepts a trailing "Z" directly
+    try:
+        if isinstance(ts, (int, float)):
+            return datetime.fromtimestamp(ts, tz=timezone.utc)
+        parsed = datetime.fromisoformat(ts)
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError) as e:
+        logger.debug(f"Error parsing timestamp {ts!r}: {e}")
+        return None
+
+
+@dataclass(slots=True, frozen=True)
 class WalletActivity:
     """Represents a single activity record for a wallet."""
 
@@ -21,7 +49,7 @@ class WalletActivity:
     price: float | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WalletSummary:
     """Summary of a wallet's trading history."""
 
@@ -31,7 +59,7 @@ class WalletSummary:
     activities: list[WalletActivity]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     """A user's position in a market."""
 
@@ -50,7 +78,7 @@ class Position:
     redeemable: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PortfolioSummary:
     """Aggregate portfolio stats from positions endpoint."""
 
@@ -66,9 +94,23 @@ class PortfolioSummary:
 class DataApiClient:
     """Client for Polymarket Data API."""
 
+    MAX_CONCURRENT_REQUESTS = 10
+    PAGE_SIZE = 500  # max rows per /activity request
+
     def __init__(self, base_url: str = "https://data-api.polymarket.com"):
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+        )
+        # Position values move on the minute scale; a short TTL is enough
+        self._summary_cache = LRUTTLCache(max_size=256, ttl_seconds=30)
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
 
     async def close(self):
         """Close the HTTP client."""
@@ -93,7 +135,7 @@ class DataApiClient:
         """
         params = {
             "user": address,
-            "limit": min(limit, 500),
+            "limit": min(limit, self.PAGE_SIZE),
             "sortBy": "TIMESTAMP",
             "sortDirection": "ASC",  # Get oldest first to find first trade
         }
@@ -107,40 +149,43 @@ class DataApiClient:
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         activities = []
+        append = activities.append
+        # Count only TRADE activities for trade count; results are sorted
+        # oldest first, so the first TRADE seen is the first trade
+        trade_count = 0
+        first_trade_at = None
         for item in data:
-            ts = item.get("timestamp")
-            if not ts:
+            get = item.get
+            timestamp = parse_timestamp(get("timestamp"))
+            if timestamp is None:
                 continue
-            # Handle both Unix timestamp (int) and ISO string
-            if isinstance(ts, (int, float)):
-                timestamp = datetime.fromtimestamp(ts)
-            else:
-                timestamp = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
 
+            price = get("price")
             activity = WalletActivity(
                 timestamp=timestamp,
-                transaction_hash=item.get("transactionHash", ""),
-                activity_type=item.get("type", "UNKNOWN"),
-                size=float(item.get("size", 0)),
-                usd_size=float(item.get("usdcSize", 0)),
-                market_id=item.get("conditionId"),
-                market_title=item.get("title"),
-                side=item.get("side"),
-                price=float(item["price"]) if item.get("price") else None,
+                transaction_hash=get("transactionHash", ""),
+                activity_type=get("type", "UNKNOWN"),
+                size=float(get("size", 0)),
+                usd_size=float(get("usdcSize", 0)),
+                market_id=get("conditionId"),
+                market_title=get("title"),
+                side=get("side"),
+                price=float(price) if price else None,
             )
-            activities.append(activity)
+            append(activity)
 
-        # Count only TRADE activities for trade count
-        trade_activities = [a for a in activities if a.activity_type == "TRADE"]
-        first_trade = trade_activities[0] if trade_activities else None
+            if activity.activity_type == "TRADE":
+                trade_count += 1
+                if first_trade_at is None:
+                    first_trade_at = activity.timestamp
 
         return WalletSummary(
             address=address,
-            total_trades=len(trade_activities),
-            first_trade_at=first_trade.timestamp if first_trade else None,
+            total_trades=trade_count,
+            first_trade_at=first_trade_at,
             activities=activities,
         )
 
@@ -171,7 +216,7 @@ class DataApiClient:
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         if data and len(data) > 0:
             return float(data[0].get("value", 0))
         return 0.0
@@ -193,26 +238,29 @@ class DataApiClient:
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         positions = []
+        append = positions.append
 
         for item in data:
-            position = Position(
-                market_id=item.get("conditionId", ""),
-                market_title=item.get("title", "Unknown"),
-                market_slug=item.get("slug", ""),
-                outcome=item.get("outcome", ""),
-                size=float(item.get("size", 0)),
-                avg_price=float(item.get("avgPrice", 0)),
-                initial_value=float(item.get("initialValue", 0)),
-                current_value=float(item.get("currentValue", 0)),
-                cash_pnl=float(item.get("cashPnl", 0)),
-                percent_pnl=float(item.get("percentPnl", 0)),
-                realized_pnl=float(item.get("realizedPnl", 0)),
-                current_price=float(item.get("curPrice", 0)),
-                redeemable=item.get("redeemable", False),
+            get = item.get
+            append(
+                Position(
+                    market_id=get("conditionId", ""),
+                    market_title=get("title", "Unknown"),
+                    market_slug=get("slug", ""),
+                    outcome=get("outcome", ""),
+                    size=float(get("size", 0)),
+                    avg_price=float(get("avgPrice", 0)),
+                    initial_value=float(get("initialValue", 0)),
+                    current_value=float(get("currentValue", 0)),
+                    cash_pnl=float(get("cashPnl", 0)),
+                    percent_pnl=float(get("percentPnl", 0)),
+                    realized_pnl=float(get("realizedPnl", 0)),
+                    current_price=float(get("curPrice", 0)),
+                    redeemable=get("redeemable", False),
+                )
             )
-            positions.append(position)
 
         return positions
 
@@ -220,7 +268,8 @@ class DataApiClient:
         """
         Get aggregate portfolio stats by summing all positions.
 
-        This is much faster than fetching all individual trades.
+        This is much faster than fetching all individual trades. Summaries
+        are cached per address for a short time.
 
         Args:
             address: Wallet address
@@ -228,6 +277,10 @@ class DataApiClient:
         Returns:
             PortfolioSummary with aggregate stats
         """
+        cached = self._summary_cache.get(address)
+        if cached is not None:
+            return cached
+
         positions = await self.get_positions(address)
 
         total_value = sum(p.current_value for p in positions)
@@ -235,7 +288,7 @@ class DataApiClient:
         unrealized_pnl = sum(p.cash_pnl for p in positions)
         realized_pnl = sum(p.realized_pnl for p in positions)
 
-        return PortfolioSummary(
+        summary = PortfolioSummary(
             address=address,
             position_count=len(positions),
             total_value=total_value,
@@ -244,3 +297,26 @@ class DataApiClient:
             realized_pnl=realized_pnl,
             positions=positions,
         )
+        self._summary_cache.set(address, summary)
+        return summary
+
+    async def get_portfolio_summaries(
+        self, addresses: list[str]
+    ) -> list[PortfolioSummary]:
+        """
+        Get portfolio summaries for several wallets concurrently.
+
+        At most MAX_CONCURRENT_REQUESTS summaries are fetched at once.
+
+        Args:
+            addresses: Wallet addresses
+
+        Returns:
+            One PortfolioSummary per address, in the order given
+        """
+
+        async def fetch(address: str) -> PortfolioSummary:
+            async with self._request_slots:
+                return await self.get_portfolio_summary(address)
+
+        return await asyncio.gather(*(fetch(a) for a in addresses))
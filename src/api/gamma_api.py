@@ -4,8 +4,10 @@ from dataclasses import dataclass
 
 import httpx
 
+from .cache import LRUTTLCache
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Market:
     """Represents a Polymarket market."""
 
@@ -19,7 +21,7 @@ class Market:
     outcomes: list[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     """Represents a Polymarket event (can contain multiple markets)."""
 
@@ -34,8 +36,17 @@ class GammaApiClient:
 
     def __init__(self, base_url: str = "https://gamma-api.polymarket.com"):
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=30.0)
-        self._market_cache: dict[str, Market] = {}
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+        )
+        # Market metadata changes slowly; bound the cache for long runs
+        self._market_cache = LRUTTLCache(max_size=1000, ttl_seconds=3600)
 
     async def close(self):
         """Close the HTTP client."""
@@ -52,8 +63,9 @@ class GammaApiClient:
             Market object or None if not found
         """
         # Check cache first
-        if condition_id in self._market_cache:
-            return self._market_cache[condition_id]
+        market = self._market_cache.get(condition_id)
+        if market is not None:
+            return market
 
         try:
             response = await self._client.get(
@@ -79,7 +91,7 @@ class GammaApiClient:
                 outcomes=market_data.get("outcomes", ["Yes", "No"]),
             )
 
-            self._market_cache[condition_id] = market
+            self._market_cache.set(condition_id, market)
             return market
 
         except httpx.HTTPStatusError:
@@ -133,6 +145,6 @@ class GammaApiClient:
                 outcomes=market_data.get("outcomes", ["Yes", "No"]),
             )
             markets.append(market)
-            self._market_cache[market.id] = market
+            self._market_cache.set(market.id, market)
 
         return markets
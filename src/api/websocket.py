@@ -1,19 +1,20 @@
 """WebSocket client for Polymarket Real-Time Data Socket (RTDS)."""
 
 import asyncio
-import json
 import logging
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Awaitable, Callable
 
+import orjson
 import websockets
 from websockets.asyncio.client import ClientConnection
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Trade:
     """Represents a trade from the RTDS WebSocket."""
 
@@ -28,7 +29,7 @@ class Trade:
     event_slug: str
     transaction_hash: str
     # User info
-    proxy_wallet: str  # Trader's proxy wallet address
+    proxy_wallet: str  # Trader's proxy wallet address, lowercase
     pseudonym: str | None = None
 
     @property
@@ -46,6 +47,7 @@ class RtdsWebSocketClient:
     WEBSOCKET_URL = "wss://ws-live-data.polymarket.com"
     PING_INTERVAL = 5  # seconds
     RECONNECT_DELAY = 5  # seconds
+    MESSAGE_QUEUE_SIZE = 1000  # received messages waiting to be handled
 
     def __init__(
         self,
@@ -59,11 +61,22 @@ class RtdsWebSocketClient:
         self._ws: ClientConnection | None = None
         self._running = False
         self._ping_task: asyncio.Task | None = None
+        # The task running connect(), and an event set once it has returned
+        self._connect_task: asyncio.Task | None = None
+        self._stopped: asyncio.Event | None = None
 
     async def connect(self):
         """Connect to the RTDS WebSocket and start listening."""
         self._running = True
+        self._connect_task = asyncio.current_task()
+        self._stopped = asyncio.Event()
+        try:
+            await self._run()
+        finally:
+            self._stopped.set()
 
+    async def _run(self):
+        """Keep a connection open, reconnecting until disconnect()."""
         while self._running:
             try:
                 logger.info(f"Connecting to {self.WEBSOCKET_URL}...")
@@ -109,10 +122,21 @@ class RtdsWebSocketClient:
                 await asyncio.sleep(self.RECONNECT_DELAY)
 
     async def disconnect(self):
-        """Disconnect from the WebSocket."""
+        """
+        Disconnect from the WebSocket.
+
+        Waits until connect() has returned, so every message already
+        received has been passed to on_trade by the time this returns.
+        """
         self._running = False
         if self._ws:
+            # connect() drains the message queue, then returns
             await self._ws.close()
+        elif self._connect_task:
+            # Connecting or waiting to reconnect; nothing to drain
+            self._connect_task.cancel()
+        if self._stopped:
+            await self._stopped.wait()
 
     async def _subscribe_to_trades(self):
         """Subscribe to trade messages."""
@@ -129,36 +153,74 @@ class RtdsWebSocketClient:
             ],
         }
 
-        await self._ws.send(json.dumps(subscribe_msg))
+        # Decoded so it goes out as a text frame
+        await self._ws.send(orjson.dumps(subscribe_msg).decode())
         logger.info("Subscribed to trades")
 
     async def _ping_loop(self):
         """Send periodic pings to keep connection alive."""
-        while self._running and self._ws:
+        # Schedule against the loop clock so slow pings don't push later ones
+        loop = asyncio.get_running_loop()
+        next_ping = loop.time() + self.PING_INTERVAL
+        while self._running:
+            await asyncio.sleep(max(0.0, next_ping - loop.time()))
+            next_ping += self.PING_INTERVAL
+
+            ws = self._ws
+            if ws is None:
+                break
             try:
-                await asyncio.sleep(self.PING_INTERVAL)
-                if self._ws:
-                    await self._ws.ping()
+                await ws.ping()
+            except websockets.ConnectionClosed:
+                break
             except Exception as e:
-                logger.debug(f"Ping error: {e}")
+                logger.warning(f"Ping error: {e}")
                 break
 
     async def _listen(self):
-        """Listen for incoming messages."""
+        """
+        Listen for incoming messages.
+
+        Messages are handed to a dispatcher task through a bounded queue, so
+        the socket keeps being read while a trade callback is running. They
+        are still handled one at a time, in the order received.
+        """
         if not self._ws:
             return
 
-        async for message in self._ws:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.MESSAGE_QUEUE_SIZE)
+        dispatcher = asyncio.create_task(self._dispatch(queue))
+        closed: websockets.ConnectionClosed | None = None
+        try:
+            try:
+                async for message in self._ws:
+                    await queue.put(message)
+            except websockets.ConnectionClosed as e:
+                closed = e
+            # Handle everything already received before reconnecting
+            await queue.join()
+        finally:
+            dispatcher.cancel()
+
+        if closed:
+            raise closed
+
+    async def _dispatch(self, queue: asyncio.Queue):
+        """Handle queued messages one at a time."""
+        while True:
+            message = await queue.get()
             try:
                 await self._handle_message(message)
             except Exception as e:
                 logger.error(f"Error handling message: {e}")
+            finally:
+                queue.task_done()
 
-    async def _handle_message(self, raw_message: str):
+    async def _handle_message(self, raw_message: str | bytes):
         """Parse and handle an incoming message."""
         try:
-            data = json.loads(raw_message)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw_message)
+        except orjson.JSONDecodeError:
             logger.debug(f"Non-JSON message: {raw_message[:100]}")
             return
 
@@ -192,7 +254,9 @@ class RtdsWebSocketClient:
                 slug=payload.get("slug", ""),
                 event_slug=payload.get("eventSlug", ""),
                 transaction_hash=payload.get("transactionHash", ""),
-                proxy_wallet=payload.get("proxyWallet", ""),
+                # Normalized once here so downstream code can compare and
+                # store it as-is; interning shares one copy per wallet
+                proxy_wallet=sys.intern(payload.get("proxyWallet", "").lower()),
                 pseudonym=payload.get("pseudonym"),
             )
 
@@ -25,6 +25,8 @@ class LoggingConfig:
     file: str
     max_file_size_mb: int
     backup_count: int
+    # "inprocess" (size-based rotation) or "external" (logrotate)
+    rotation_mode: str = "inprocess"
 
 
 @dataclass
@@ -1,11 +1,29 @@
 """SQLite database schema and models."""
 
+# Connection settings applied on every open. WAL with synchronous=NORMAL
+# avoids an fsync per commit while staying crash-safe for the database file.
+PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA mmap_size = 268435456;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+"""
+
 SCHEMA = """
 -- Cache wallet trade counts to avoid repeated API calls
 CREATE TABLE IF NOT EXISTS wallet_cache (
     address TEXT PRIMARY KEY,
     trade_count INTEGER NOT NULL,
     first_trade_at TIMESTAMP,
+    last_updated TIMESTAMP NOT NULL,
+    last_updated_ts INTEGER  -- last_updated as Unix seconds, for freshness checks
+);
+
+-- Cache username -> wallet address lookups made by the analyze CLI
+CREATE TABLE IF NOT EXISTS wallet_usernames (
+    username TEXT PRIMARY KEY,
+    address TEXT NOT NULL,
     last_updated TIMESTAMP NOT NULL
 );
 
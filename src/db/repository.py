@@ -1,17 +1,34 @@
 """Database repository for wallet cache, alerts, and trades."""
 
-import json
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import aiosqlite
+import orjson
 
-from .models import SCHEMA
+from .models import PRAGMAS, SCHEMA
 
 logger = logging.getLogger(__name__)
 
+_INSERT_TRADE_SQL = """
+    INSERT OR IGNORE INTO trades (
+        transaction_hash, wallet_address, market_id, market_slug,
+        outcome, side, size, price, usd_value, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _now() -> tuple[str, int]:
+    """Current time as an ISO 8601 local time string and Unix seconds."""
+    now = time.time()
+    return datetime.fromtimestamp(now).isoformat(), int(now)
+
 
 @dataclass
 class CachedWallet:
@@ -42,28 +59,83 @@ class Alert:
 
 
 class Repository:
-    """Database repository for all persistence operations."""
+    """
+    Database repository for all persistence operations.
+
+    Writes go through a single connection. Lookups are spread round-robin
+    over ``reader_count`` extra read-only connections, which WAL mode lets
+    run alongside the writer; with no readers (or an in-memory database)
+    everything uses the writer connection.
 
-    def __init__(self, db_path: str | Path):
+    Wallet addresses are expected in lowercase, as Trade and the API
+    clients provide them, and are stored as given.
+    """
+
+    def __init__(self, db_path: str | Path, reader_count: int = 2):
         self.db_path = Path(db_path)
+        self.reader_count = reader_count
         self._connection: aiosqlite.Connection | None = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._next_reader = 0
+        self._write_lock = asyncio.Lock()
+        # Task that holds _write_lock inside transaction()
+        self._transaction_owner: asyncio.Task | None = None
 
     async def initialize(self):
         """Initialize the database and create tables."""
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._connection = await aiosqlite.connect(self.db_path)
-        self._connection.row_factory = aiosqlite.Row
+        self._connection = await self._connect()
 
         # Create tables
         await self._connection.executescript(SCHEMA)
+        await self._migrate()
         await self._connection.commit()
 
+        # Readers open once the schema exists; each :memory: connection
+        # would be a separate database, so those never get readers
+        if self.reader_count > 0 and str(self.db_path) != ":memory:":
+            self._readers = list(
+                await asyncio.gather(
+                    *(self._connect(read_only=True) for _ in range(self.reader_count))
+                )
+            )
+
         logger.info(f"Database initialized at {self.db_path}")
 
+    async def _migrate(self):
+        """Bring databases created by older versions up to the current schema."""
+        async with self.conn.execute("PRAGMA table_info(wallet_cache)") as cursor:
+            columns = {row["name"] for row in await cursor.fetchall()}
+
+        if "last_updated_ts" not in columns:
+            await self.conn.execute(
+                "ALTER TABLE wallet_cache ADD COLUMN last_updated_ts INTEGER"
+            )
+            # last_updated holds naive local times
+            await self.conn.execute(
+                """
+                UPDATE wallet_cache
+                SET last_updated_ts = CAST(strftime('%s', last_updated, 'utc') AS INTEGER)
+                """
+            )
+
+    async def _connect(self, read_only: bool = False) -> aiosqlite.Connection:
+        """Open a connection with the repository's PRAGMAs applied."""
+        connection = await aiosqlite.connect(self.db_path)
+        connection.row_factory = aiosqlite.Row
+        await connection.executescript(PRAGMAS)
+        if read_only:
+            await connection.execute("PRAGMA query_only = ON")
+        return connection
+
     async def close(self):
-        """Close the database connection."""
+        """Close the database connections."""
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+
         if self._connection:
             await self._connection.close()
             self._connection = None
@@ -75,12 +147,69 @@ class Repository:
             raise RuntimeError("Database not initialized. Call initialize() first.")
         return self._connection
 
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Run the writes inside the block as one transaction.
+
+        Commits once when the block exits and rolls back if it raises.
+        Writers in other tasks wait until the block is done, so their
+        statements never end up in (or commit) someone else's transaction.
+        Nested blocks in the same task join the outer transaction; tasks
+        created inside the block are other writers and wait like any other.
+        """
+        task = asyncio.current_task()
+        if task is not None and self._transaction_owner is task:
+            yield
+            return
+
+        async with self._write_lock:
+            self._transaction_owner = task
+            try:
+                yield
+            except BaseException:
+                await self.conn.rollback()
+                raise
+            else:
+                await self.conn.commit()
+            finally:
+                self._transaction_owner = None
+
+    @property
+    def reader(self) -> aiosqlite.Connection:
+        """Get a connection for read-only queries."""
+        if not self._readers:
+            return self.conn
+        self._next_reader = (self._next_reader + 1) % len(self._readers)
+        return self._readers[self._next_reader]
+
     # Wallet Cache Operations
 
     async def get_cached_wallet(self, address: str) -> CachedWallet | None:
         """Get cached wallet info if available."""
-        async with self.conn.execute(
-            "SELECT * FROM wallet_cache WHERE address = ?", (address.lower(),)
+        return await self._get_cached_wallet(address, updated_since=0)
+
+    async def get_cached_wallet_if_fresh(
+        self,
+        address: str,
+        max_age_hours: int = 24,
+    ) -> CachedWallet | None:
+        """Get cached wallet info if it's still fresh."""
+        return await self._get_cached_wallet(
+            address, updated_since=int(time.time()) - max_age_hours * 3600
+        )
+
+    async def _get_cached_wallet(
+        self, address: str, updated_since: int
+    ) -> CachedWallet | None:
+        """Get cached wallet info last updated at or after a Unix time."""
+        async with self.reader.execute(
+            """
+            SELECT address, trade_count, first_trade_at, last_updated_ts
+            FROM wallet_cache
+            WHERE address = ? AND last_updated_ts >= ?
+            """,
+            (address, updated_since),
         ) as cursor:
             row = await cursor.fetchone()
             if not row:
@@ -92,24 +221,15 @@ class Repository:
                 first_trade_at=datetime.fromisoformat(row["first_trade_at"])
                 if row["first_trade_at"]
                 else None,
-                last_updated=datetime.fromisoformat(row["last_updated"]),
+                last_updated=datetime.fromtimestamp(row["last_updated_ts"]),
             )
 
-    async def get_cached_wallet_if_fresh(
-        self,
-        address: str,
-        max_age_hours: int = 24,
-    ) -> CachedWallet | None:
-        """Get cached wallet info if it's still fresh."""
-        cached = await self.get_cached_wallet(address)
-        if not cached:
-            return None
-
-        age = datetime.now() - cached.last_updated
-        if age > timedelta(hours=max_age_hours):
-            return None
-
-        return cached
+    async def get_wallets_with_min_trades(self, min_trades: int) -> list[str]:
+        """Get the addresses of cached wallets with at least ``min_trades``."""
+        async with self.reader.execute(
+            "SELECT address FROM wallet_cache WHERE trade_count >= ?", (min_trades,)
+        ) as cursor:
+            return [row["address"] for row in await cursor.fetchall()]
 
     async def cache_wallet(
         self,
@@ -118,91 +238,159 @@ class Repository:
         first_trade_at: datetime | None = None,
     ):
         """Cache wallet trade count."""
-        await self.conn.execute(
-            """
-            INSERT INTO wallet_cache (address, trade_count, first_trade_at, last_updated)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(address) DO UPDATE SET
-                trade_count = excluded.trade_count,
-                first_trade_at = COALESCE(excluded.first_trade_at, wallet_cache.first_trade_at),
-                last_updated = excluded.last_updated
-            """,
-            (
-                address.lower(),
-                trade_count,
-                first_trade_at.isoformat() if first_trade_at else None,
-                datetime.now().isoformat(),
-            ),
-        )
-        await self.conn.commit()
+        async with self.transaction():
+            await self.conn.execute(
+                """
+                INSERT INTO wallet_cache (
+                    address, trade_count, first_trade_at, last_updated, last_updated_ts
+                )
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(address) DO UPDATE SET
+                    trade_count = excluded.trade_count,
+                    first_trade_at = COALESCE(excluded.first_trade_at, wallet_cache.first_trade_at),
+                    last_updated = excluded.last_updated,
+                    last_updated_ts = excluded.last_updated_ts
+                """,
+                (
+                    address,
+                    trade_count,
+                    first_trade_at.isoformat() if first_trade_at else None,
+                    *_now(),
+                ),
+            )
 
     async def increment_wallet_trade_count(self, address: str):
         """Increment the cached trade count for a wallet."""
-        await self.conn.execute(
-            """
-            UPDATE wallet_cache
-            SET trade_count = trade_count + 1, last_updated = ?
-            WHERE address = ?
-            """,
-            (datetime.now().isoformat(), address.lower()),
-        )
-        await self.conn.commit()
+        async with self.transaction():
+            await self.conn.execute(
+                """
+                UPDATE wallet_cache
+                SET trade_count = trade_count + 1, last_updated = ?, last_updated_ts = ?
+                WHERE address = ?
+                """,
+                (*_now(), address),
+            )
+
+    async def increment_wallet_trade_counts(self, counts: dict[str, int]):
+        """
+        Add to the cached trade counts of several wallets at once.
+
+        Like increment_wallet_trade_count, wallets that are not cached yet
+        are left alone.
+        """
+        async with self.transaction():
+            now, now_ts = _now()
+            await self.conn.executemany(
+                """
+                UPDATE wallet_cache
+                SET trade_count = trade_count + ?, last_updated = ?, last_updated_ts = ?
+                WHERE address = ?
+                """,
+                [(count, now, now_ts, address) for address, count in counts.items()],
+            )
+
+    # Username Cache Operations
+
+    async def get_address_for_username(
+        self,
+        username: str,
+        max_age_days: int = 30,
+    ) -> str | None:
+        """Get the cached wallet address for a username if it's still fresh."""
+        async with self.reader.execute(
+            "SELECT address, last_updated FROM wallet_usernames WHERE username = ?",
+            (username,),
+        ) as cursor:
+            row = await cursor.fetchone()
+            if not row:
+                return None
+
+        age = datetime.now() - datetime.fromisoformat(row["last_updated"])
+        if age > timedelta(days=max_age_days):
+            return None
+
+        return row["address"]
+
+    async def cache_username(self, username: str, address: str):
+        """Cache the wallet address a username resolves to."""
+        async with self.transaction():
+            await self.conn.execute(
+                """
+                INSERT OR REPLACE INTO wallet_usernames (username, address, last_updated)
+                VALUES (?, ?, ?)
+                """,
+                (username, address, datetime.now().isoformat()),
+            )
 
     # Alert Operations
 
     async def save_alert(self, alert: Alert) -> int:
         """Save an alert and return its ID."""
-        async with self.conn.execute(
-            """
-            INSERT INTO alerts (
-                created_at, alert_type, wallet_address, trade_size_usd,
-                wallet_trade_count, market_id, market_name, outcome, side,
-                transaction_hash, details
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                alert.created_at.isoformat(),
-                alert.alert_type,
-                alert.wallet_address.lower(),
-                alert.trade_size_usd,
-                alert.wallet_trade_count,
-                alert.market_id,
-                alert.market_name,
-                alert.outcome,
-                alert.side,
-                alert.transaction_hash,
-                json.dumps(alert.details) if alert.details else None,
-            ),
-        ) as cursor:
-            alert_id = cursor.lastrowid
+        async with self.transaction():
+            async with self.conn.execute(
+                """
+                INSERT INTO alerts (
+                    created_at, alert_type, wallet_address, trade_size_usd,
+                    wallet_trade_count, market_id, market_name, outcome, side,
+                    transaction_hash, details
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    alert.created_at.isoformat(),
+                    alert.alert_type,
+                    alert.wallet_address,
+                    alert.trade_size_usd,
+                    alert.wallet_trade_count,
+                    alert.market_id,
+                    alert.market_name,
+                    alert.outcome,
+                    alert.side,
+                    alert.transaction_hash,
+                    # Decoded so the column keeps holding TEXT, not BLOB
+                    orjson.dumps(alert.details).decode() if alert.details else None,
+                ),
+            ) as cursor:
+                alert_id = cursor.lastrowid
 
-        await self.conn.commit()
         return alert_id or 0
 
     async def get_recent_alerts(self, limit: int = 100) -> list[Alert]:
         """Get recent alerts."""
-        async with self.conn.execute(
-            "SELECT * FROM alerts ORDER BY created_at DESC LIMIT ?", (limit,)
+        return [alert async for alert in self.iter_recent_alerts(limit)]
+
+    async def iter_recent_alerts(self, limit: int = 100) -> AsyncIterator[Alert]:
+        """
+        Yield recent alerts, newest first, as rows are read from the cursor.
+
+        Callers that stop early don't pay for decoding the remaining rows;
+        wrap the iterator in contextlib.aclosing() when breaking out of the
+        loop so the cursor is closed right away.
+        """
+        async with self.reader.execute(
+            """
+            SELECT id, created_at, alert_type, wallet_address, trade_size_usd,
+                wallet_trade_count, market_id, market_name, outcome, side,
+                transaction_hash, details
+            FROM alerts ORDER BY created_at DESC LIMIT ?
+            """,
+            (limit,),
         ) as cursor:
-            rows = await cursor.fetchall()
-
-            return [
-                Alert(
-                    id=row["id"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    alert_type=row["alert_type"],
-                    wallet_address=row["wallet_address"],
-                    trade_size_usd=row["trade_size_usd"],
-                    wallet_trade_count=row["wallet_trade_count"],
-                    market_id=row["market_id"],
-                    market_name=row["market_name"],
-                    outcome=row["outcome"],
-                    side=row["side"],
-                    transaction_hash=row["transaction_hash"],
-                    details=json.loads(row["details"]) if row["details"] else None,
+            # Columns are read by position, in the order selected above
+            async for row in cursor:
+                yield Alert(
+                    id=row[0],
+                    created_at=datetime.fromisoformat(row[1]),
+                    alert_type=row[2],
+                    wallet_address=row[3],
+                    trade_size_usd=row[4],
+                    wallet_trade_count=row[5],
+                    market_id=row[6],
+                    market_name=row[7],
+                    outcome=row[8],
+                    side=row[9],
+                    transaction_hash=row[10],
+                    details=orjson.loads(row[11]) if row[11] else None,
                 )
-                for row in rows
-            ]
 
     # Trade Operations
 
@@ -221,35 +409,62 @@ class Repository:
     ):
         """Save a trade record."""
         try:
-            await self.conn.execute(
-                """
-                INSERT OR IGNORE INTO trades (
-                    transaction_hash, wallet_address, market_id, market_slug,
-                    outcome, side, size, price, usd_value, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    transaction_hash,
-                    wallet_address.lower(),
-                    market_id,
-                    market_slug,
-                    outcome,
-                    side,
-                    size,
-                    price,
-                    usd_value,
-                    timestamp.isoformat(),
-                ),
-            )
-            await self.conn.commit()
+            async with self.transaction():
+                await self.conn.execute(
+                    _INSERT_TRADE_SQL,
+                    (
+                        transaction_hash,
+                        wallet_address,
+                        market_id,
+                        market_slug,
+                        outcome,
+                        side,
+                        size,
+                        price,
+                        usd_value,
+                        timestamp.isoformat(),
+                    ),
+                )
         except Exception as e:
             logger.debug(f"Error saving trade (likely duplicate): {e}")
 
+    async def save_trades(self, rows: list[tuple]):
+        """
+        Save a batch of trade records in a single transaction.
+
+        Each row is (transaction_hash, wallet_address, market_id, market_slug,
+        outcome, side, size, price, usd_value, timestamp) with the wallet
+        address lowercased and the timestamp as an ISO 8601 string.
+        Duplicate transaction hashes are ignored.
+        """
+        async with self.transaction():
+            await self.conn.executemany(_INSERT_TRADE_SQL, rows)
+
+    async def count_wallet_trades(self, address: str) -> int:
+        """
+        Count a wallet's trades recorded by the watcher.
+
+        Only trades seen on the stream are in the table, so this is a lower
+        bound on the wallet's real history.
+        """
+        async with self.reader.execute(
+            "SELECT COUNT(*) FROM trades WHERE wallet_address = ?",
+            (address,),
+        ) as cursor:
+            row = await cursor.fetchone()
+            return row[0]
+
     async def get_wallet_trade_count_from_db(self, address: str) -> int:
-        """Count trades for a wallet from our local trade history."""
-        async with self.conn.execute(
-            "SELECT COUNT(*) as count FROM trades WHERE wallet_address = ?",
-            (address.lower(),),
+        """
+        Get a wallet's trade count as tracked in the wallet cache.
+
+        The count is kept current by cache_wallet and the batched increments
+        from streamed trades, so this is a primary key lookup instead of a
+        COUNT over the trades table. Returns 0 for wallets that aren't cached.
+        """
+        async with self.reader.execute(
+            "SELECT trade_count FROM wallet_cache WHERE address = ?",
+            (address,),
         ) as cursor:
             row = await cursor.fetchone()
-            return row["count"] if row else 0
+            return row["trade_count"] if row else 0
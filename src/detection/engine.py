@@ -1,6 +1,8 @@
 """Detection engine - orchestrates all detection rules."""
 
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Protocol
 
 from ..api import Trade
@@ -24,9 +26,15 @@ class DetectionEngine:
     Orchestrates all detection rules and processes trades.
 
     The engine runs each detector against incoming trades and
-    collects any alerts generated.
+    collects any alerts generated. Trades and wallet trade count updates
+    are written to the database in batches, either once TRADE_BATCH_SIZE
+    trades are pending or every FLUSH_INTERVAL seconds; call close() to
+    write out the remainder.
     """
 
+    TRADE_BATCH_SIZE = 256
+    FLUSH_INTERVAL = 1.0  # seconds
+
     def __init__(
         self,
         repository: Repository,
@@ -36,6 +44,10 @@ class DetectionEngine:
         self.detectors: list[Detector] = detectors or []
         self._trade_count = 0
         self._alert_count = 0
+        self._pending_trades: list[tuple] = []
+        self._pending_increments: defaultdict[str, int] = defaultdict(int)
+        self._flush_task: asyncio.Task | None = None
+        self._closed = asyncio.Event()
 
     def add_detector(self, detector: Detector):
         """Add a detector to the engine."""
@@ -55,45 +67,113 @@ class DetectionEngine:
         self._trade_count += 1
         alerts: list[Alert] = []
 
-        for detector in self.detectors:
-            try:
-                alert = await detector.analyze(trade)
-                if alert:
-                    # Save alert to database
-                    alert_id = await self.repository.save_alert(alert)
-                    alert.id = alert_id
-                    alerts.append(alert)
-                    self._alert_count += 1
+        # Detectors wait on independent API calls, so run them concurrently;
+        # alerts are saved afterwards, one at a time, in detector order
+        results = await asyncio.gather(
+            *(detector.analyze(trade) for detector in self.detectors),
+            return_exceptions=True,
+        )
+        for detector, result in zip(self.detectors, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Error in detector {detector.ALERT_TYPE}: {result}",
+                    exc_info=result,
+                )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            if not result:
+                continue
 
+            try:
+                # Save alert to database
+                result.id = await self.repository.save_alert(result)
+                alerts.append(result)
+                self._alert_count += 1
             except Exception as e:
                 logger.error(
-                    f"Error in detector {detector.ALERT_TYPE}: {e}",
+                    f"Error saving {detector.ALERT_TYPE} alert: {e}",
                     exc_info=True,
                 )
 
-        # Optionally save trade for historical analysis
-        try:
-            await self.repository.save_trade(
-                transaction_hash=trade.transaction_hash,
-                wallet_address=trade.proxy_wallet,
-                market_id=trade.condition_id,
-                market_slug=trade.slug,
-                outcome=trade.outcome,
-                side=trade.side,
-                size=trade.size,
-                price=trade.price,
-                usd_value=trade.usd_value,
-                timestamp=trade.timestamp,
+        # Queue trade for historical analysis
+        wallet = trade.proxy_wallet
+        self._pending_trades.append(
+            (
+                trade.transaction_hash,
+                wallet,
+                trade.condition_id,
+                trade.slug,
+                trade.outcome,
+                trade.side,
+                trade.size,
+                trade.price,
+                trade.usd_value,
+                trade.timestamp.isoformat(),
             )
-        except Exception as e:
-            logger.debug(f"Error saving trade: {e}")
+        )
 
         # Update wallet cache if we have it
-        if trade.proxy_wallet:
-            await self.repository.increment_wallet_trade_count(trade.proxy_wallet)
+        if wallet:
+            self._pending_increments[wallet] += 1
+
+        # Once closed there is no timer, so write straight away
+        if len(self._pending_trades) >= self.TRADE_BATCH_SIZE or self._closed.is_set():
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
 
         return alerts
 
+    async def flush(self):
+        """Write pending trades and wallet trade counts in one transaction."""
+        if not self._pending_trades and not self._pending_increments:
+            return
+
+        rows, self._pending_trades = self._pending_trades, []
+        counts = self._pending_increments
+        self._pending_increments = defaultdict(int)
+        try:
+            async with self.repository.transaction():
+                if rows:
+                    await self.repository.save_trades(rows)
+                if counts:
+                    await self.repository.increment_wallet_trade_counts(counts)
+        except asyncio.CancelledError:
+            # The transaction was rolled back; requeue so a later flush
+            # writes these rows
+            self._pending_trades[:0] = rows
+            for wallet, count in counts.items():
+                self._pending_increments[wallet] += count
+            raise
+        except Exception as e:
+            logger.warning(
+                f"Error saving {len(rows)} trades and "
+                f"{len(counts)} wallet trade counts: {e}"
+            )
+
+    async def _flush_loop(self):
+        """Periodically write pending trades until the engine is closed."""
+        while not self._closed.is_set():
+            try:
+                await asyncio.wait_for(self._closed.wait(), self.FLUSH_INTERVAL)
+            except TimeoutError:
+                await self.flush()
+
+    async def close(self):
+        """
+        Stop the flush timer and write any pending trades.
+
+        A flush already in progress is allowed to finish rather than being
+        cancelled, so its rows are not rolled back.
+        """
+        self._closed.set()
+        if self._flush_task:
+            await self._flush_task
+            self._flush_task = None
+
+        await self.flush()
+
     @property
     def stats(self) -> dict:
         """Get engine statistics."""
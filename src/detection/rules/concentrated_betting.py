@@ -1,9 +1,10 @@
 """Concentrated betting detector - flags accounts with high volume but few trades."""
 
+import heapq
 import logging
-from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter
 
 from ...api import DataApiClient
 from ...db import Alert, Repository
@@ -67,13 +68,27 @@ class ConcentratedBettingDetector:
         Returns:
             Alert if anomaly detected, None otherwise
         """
+        # Callers may pass any case; the repository and alerts use lowercase
+        address = address.lower()
+
         # Skip if already analyzed this session
-        if address.lower() in self._analyzed_wallets:
+        if address in self._analyzed_wallets:
             return None
 
-        self._analyzed_wallets.add(address.lower())
+        self._analyzed_wallets.add(address)
 
         try:
+            # Trades recorded locally are a lower bound on the wallet's
+            # history; if they already exceed the concentration limit the
+            # wallet can't qualify, so skip the API call
+            local_trades = await self.repository.count_wallet_trades(address)
+            if local_trades > self.config.max_trades_for_concentration:
+                logger.debug(
+                    f"Wallet {address[:10]}... has {local_trades} recorded trades, "
+                    f"above threshold of {self.config.max_trades_for_concentration}"
+                )
+                return None
+
             analysis = await self._get_wallet_analysis(address)
         except Exception as e:
             logger.error(f"Error analyzing wallet {address[:10]}...: {e}")
@@ -147,28 +162,33 @@ class ConcentratedBettingDetector:
         )
 
         trades = summary.activities
-        total_volume = sum(t.usd_size for t in trades)
-        avg_trade = total_volume / len(trades) if trades else 0
 
-        # Analyze market concentration
-        market_volumes: Counter[str] = Counter()
+        # Analyze volume and market concentration in one pass
+        total_volume = 0.0
+        market_volumes: dict[str, float] = {}
         market_titles: dict[str, str] = {}
 
         for trade in trades:
             market_id = trade.market_id or "unknown"
-            market_volumes[market_id] += trade.usd_size
+            total_volume += trade.usd_size
+            market_volumes[market_id] = (
+                market_volumes.get(market_id, 0.0) + trade.usd_size
+            )
             if trade.market_title:
                 market_titles[market_id] = trade.market_title
 
+        avg_trade = total_volume / len(trades) if trades else 0
         unique_markets = len(market_volumes)
-        top_market_volume = market_volumes.most_common(1)[0][1] if market_volumes else 0
+
+        # Top 5 markets by volume, without sorting them all
+        top_markets = heapq.nlargest(5, market_volumes.items(), key=itemgetter(1))
+        top_market_volume = top_markets[0][1] if top_markets else 0
         top_concentration = (
             (top_market_volume / total_volume * 100) if total_volume else 0
         )
 
         # Get titles of top markets
-        top_market_ids = [m[0] for m in market_volumes.most_common(5)]
-        titles = [market_titles.get(mid, mid[:20]) for mid in top_market_ids]
+        titles = [market_titles.get(mid, mid[:20]) for mid, _ in top_markets]
 
         return WalletAnalysis(
             address=address,
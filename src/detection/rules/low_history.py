@@ -1,5 +1,6 @@
 """Low history detector - flags large trades from wallets with minimal trade history."""
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -39,6 +40,19 @@ class LowHistoryDetector:
         self.config = config
         self.repository = repository
         self.data_api = data_api
+        # Lookups in progress, so concurrent trades from one wallet share them
+        self._in_flight: dict[str, asyncio.Task[int | None]] = {}
+        # Wallets already at or above the threshold; trade counts only grow,
+        # so these never need to be looked up again
+        self._established_wallets: set[str] = set()
+
+    async def load_established_wallets(self):
+        """Preload cached wallets whose history is already above the threshold."""
+        addresses = await self.repository.get_wallets_with_min_trades(
+            self.config.low_history_threshold
+        )
+        self._established_wallets.update(addresses)
+        logger.info(f"Loaded {len(addresses)} established wallets")
 
     async def analyze(self, trade: Trade) -> Alert | None:
         """
@@ -61,11 +75,21 @@ class LowHistoryDetector:
             f"Large trade detected: ${usd_value:,.2f} from {trade.proxy_wallet[:10]}..."
         )
 
+        wallet = trade.proxy_wallet
+        if wallet in self._established_wallets:
+            return None
+
         # Get wallet trade count
         trade_count = await self._get_wallet_trade_count(trade.proxy_wallet)
 
+        # Unknown after an API error; don't alert (or remember the wallet)
+        # so a later trade looks it up again
+        if trade_count is None:
+            return None
+
         # Check if wallet has low history
         if trade_count >= self.config.low_history_threshold:
+            self._established_wallets.add(wallet)
             logger.debug(
                 f"Wallet {trade.proxy_wallet[:10]}... has {trade_count} trades, "
                 f"above threshold of {self.config.low_history_threshold}"
@@ -95,16 +119,29 @@ class LowHistoryDetector:
 
         return alert
 
-    async def _get_wallet_trade_count(self, address: str) -> int:
+    async def _get_wallet_trade_count(self, address: str) -> int | None:
         """
         Get the trade count for a wallet, using cache when available.
 
+        Concurrent calls for the same wallet wait on a single lookup.
+
         Args:
             address: Wallet address
 
         Returns:
-            Number of historical trades
+            Number of historical trades, or None if it could not be fetched
         """
+        task = self._in_flight.get(address)
+        if task is None:
+            task = asyncio.create_task(self._lookup_wallet_trade_count(address))
+            self._in_flight[address] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(address, None))
+
+        # Shielded so one cancelled caller doesn't cancel the others' lookup
+        return await asyncio.shield(task)
+
+    async def _lookup_wallet_trade_count(self, address: str) -> int | None:
+        """Look up a wallet's trade count in the cache, then the Data API."""
         # Check cache first
         cached = await self.repository.get_cached_wallet_if_fresh(
             address,
@@ -142,5 +179,4 @@ class LowHistoryDetector:
 
         except Exception as e:
             logger.error(f"Error fetching wallet history for {address}: {e}")
-            # Return a high number to avoid false positives on API errors
-            return 999
+            return None
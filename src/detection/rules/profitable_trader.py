@@ -1,8 +1,9 @@
 """Profitable trader detector - flags wallets with suspicious profitability patterns."""
 
+import heapq
 import logging
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 from ...api import DataApiClient, Trade
@@ -11,7 +12,7 @@ from ...db import Alert, Repository
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfitableTraderConfig:
     """Configuration for the profitable trader detector."""
 
@@ -25,36 +26,67 @@ class ProfitableTraderConfig:
     high_frequency_threshold: int
     # Cache TTL for wallet stats
     cache_ttl_hours: int
+    # Wallets tracked in memory; the least recently active are evicted
+    max_tracked_wallets: int = 100_000
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletStats:
-    """Tracked statistics for a wallet."""
+    """
+    Tracked statistics for a wallet.
+
+    Trades themselves are not retained, only the counters derived from them;
+    trade_count stops at MAX_TRADE_COUNT. Derived metrics are stored as
+    fields and refreshed by add_trade() and add_round_trip() instead of being
+    recomputed on every read.
+    """
+
+    MAX_TRADE_COUNT = 1000
 
     address: str
-    trades: list[Trade]
     first_seen: datetime
     last_seen: datetime
 
+    # Unix seconds of first_seen/last_seen, for cheap day arithmetic
+    first_seen_ts: int = field(init=False)
+    last_seen_ts: int = field(init=False)
+
     # Computed metrics
     total_volume: float = 0
     estimated_pnl: float = 0
     win_count: int = 0
     loss_count: int = 0
+    trade_count: int = 0
+    win_rate: float = 0
+    trades_per_day: float = 0
+
+    def __post_init__(self):
+        self.first_seen_ts = int(self.first_seen.timestamp())
+        self.last_seen_ts = int(self.last_seen.timestamp())
+
+    def add_trade(self, trade: Trade):
+        """Record a trade and refresh the metrics that depend on it."""
+        self.last_seen = trade.timestamp
+        self.last_seen_ts = int(trade.timestamp.timestamp())
+        self.total_volume += trade.usd_value
 
-    @property
-    def trade_count(self) -> int:
-        return len(self.trades)
+        if self.trade_count < self.MAX_TRADE_COUNT:
+            self.trade_count += 1
 
-    @property
-    def win_rate(self) -> float:
-        total = self.win_count + self.loss_count
-        return self.win_count / total if total > 0 else 0
+        days = max(1, (self.last_seen_ts - self.first_seen_ts) // 86400 + 1)
+        self.trades_per_day = self.trade_count / days
 
-    @property
-    def trades_per_day(self) -> float:
-        days = max(1, (self.last_seen - self.first_seen).days + 1)
-        return self.trade_count / days
+    def add_round_trip(self, pnl: float):
+        """Record the estimated P&L of a matched buy and sell."""
+        self.estimated_pnl += pnl
+        if pnl > 0:
+            self.win_count += 1
+        elif pnl < 0:
+            self.loss_count += 1
+        else:
+            return
+
+        self.win_rate = self.win_count / (self.win_count + self.loss_count)
 
 
 class ProfitableTraderDetector:
@@ -84,12 +116,17 @@ class ProfitableTraderDetector:
         self.repository = repository
         self.data_api = data_api
 
-        # In-memory tracking of wallet activity
-        self._wallet_stats: dict[str, WalletStats] = {}
-        self._position_tracker: dict[str, dict[str, list[Trade]]] = defaultdict(
-            lambda: defaultdict(list)
-        )
+        # In-memory tracking of wallet activity, least recently active first
+        self._wallet_stats: OrderedDict[str, WalletStats] = OrderedDict()
+        # Open buys per (wallet, condition_id, outcome) as (price, size),
+        # oldest first, plus each wallet's keys so eviction can drop them
+        self._position_tracker: dict[
+            tuple[str, str, str], deque[tuple[float, float]]
+        ] = {}
+        self._position_keys: dict[str, list[tuple[str, str, str]]] = defaultdict(list)
         self._alerted_wallets: set[str] = set()  # Avoid duplicate alerts
+        # Wallets currently meeting the get_suspicious_wallets criteria
+        self._suspicious_wallets: set[str] = set()
 
     async def analyze(self, trade: Trade) -> Alert | None:
         """
@@ -109,7 +146,8 @@ class ProfitableTraderDetector:
         stats = self._update_wallet_stats(wallet, trade)
 
         # Track position for P&L estimation
-        self._track_position(wallet, trade)
+        self._track_position(stats, trade)
+        self._update_suspicion(stats)
 
         # Check if we have enough data to analyze
         if stats.trade_count < self.config.min_trades_for_analysis:
@@ -129,76 +167,97 @@ class ProfitableTraderDetector:
 
     def _update_wallet_stats(self, wallet: str, trade: Trade) -> WalletStats:
         """Update statistics for a wallet."""
-        if wallet not in self._wallet_stats:
-            self._wallet_stats[wallet] = WalletStats(
+        stats = self._wallet_stats.get(wallet)
+        if stats is None:
+            if len(self._wallet_stats) >= self.config.max_tracked_wallets:
+                self._evict_wallet()
+            stats = self._wallet_stats[wallet] = WalletStats(
                 address=wallet,
-                trades=[],
                 first_seen=trade.timestamp,
                 last_seen=trade.timestamp,
             )
+        else:
+            self._wallet_stats.move_to_end(wallet)
 
-        stats = self._wallet_stats[wallet]
-        stats.trades.append(trade)
-        stats.last_seen = trade.timestamp
-        stats.total_volume += trade.usd_value
-
-        # Keep only recent trades to limit memory
-        max_trades = 1000
-        if len(stats.trades) > max_trades:
-            stats.trades = stats.trades[-max_trades:]
+        stats.add_trade(trade)
 
         return stats
 
-    def _track_position(self, wallet: str, trade: Trade):
+    def _evict_wallet(self):
+        """Forget the least recently active wallet."""
+        wallet, _ = self._wallet_stats.popitem(last=False)
+        for key in self._position_keys.pop(wallet, ()):
+            del self._position_tracker[key]
+        self._suspicious_wallets.discard(wallet)
+
+    def _track_position(self, stats: WalletStats, trade: Trade):
         """Track positions to estimate P&L."""
-        market_key = f"{trade.condition_id}:{trade.outcome}"
-        positions = self._position_tracker[wallet][market_key]
+        # A tuple key reuses the strings' cached hashes instead of building
+        # and hashing a new string per trade
+        key = (stats.address, trade.condition_id, trade.outcome)
+        positions = self._position_tracker.get(key)
+        if positions is None:
+            if trade.side != "BUY":
+                return
+            positions = self._position_tracker[key] = deque()
+            self._position_keys[stats.address].append(key)
 
         if trade.side == "BUY":
-            positions.append(trade)
+            positions.append((trade.price, trade.size))
         elif trade.side == "SELL" and positions:
             # Match with oldest buy (FIFO)
-            buy_trade = positions.pop(0)
-
-            # Estimate P&L from the round trip
-            pnl = (trade.price - buy_trade.price) * min(trade.size, buy_trade.size)
-
-            stats = self._wallet_stats.get(wallet)
-            if stats:
-                stats.estimated_pnl += pnl
-                if pnl > 0:
-                    stats.win_count += 1
-                elif pnl < 0:
-                    stats.loss_count += 1
+            buy_price, buy_size = positions.popleft()
+
+            # Estimate P&L from the round trip; an unchanged price is
+            # neither a win nor a loss and adds nothing
+            price_delta = trade.price - buy_price
+            if price_delta:
+                stats.add_round_trip(price_delta * min(trade.size, buy_size))
+
+    def _update_suspicion(self, stats: WalletStats):
+        """Add or remove a wallet from the suspicious set after an update."""
+        if stats.trade_count >= self.config.min_trades_for_analysis and (
+            stats.win_rate >= self.config.min_win_rate
+            or stats.trades_per_day >= self.config.high_frequency_threshold
+        ):
+            self._suspicious_wallets.add(stats.address)
+        else:
+            self._suspicious_wallets.discard(stats.address)
 
     def _check_for_anomalies(
         self, stats: WalletStats, latest_trade: Trade
     ) -> Alert | None:
         """Check if wallet stats indicate suspicious patterns."""
-        reasons = []
-
-        # Check win rate
-        if stats.win_rate >= self.config.min_win_rate:
-            reasons.append(f"High win rate: {stats.win_rate * 100:.1f}%")
+        config = self.config
+        win_count = stats.win_count
+        loss_count = stats.loss_count
+
+        # Score the three checks first and only format reasons for the rare
+        # wallet that gets flagged. The profit factor is approximated from
+        # the win/loss ratio (real P&L amounts would be better); comparing
+        # against threshold * losses avoids dividing on every trade.
+        high_win_rate = stats.win_rate >= config.min_win_rate
+        high_profit_factor = (
+            win_count > 0
+            and loss_count > 0
+            and win_count >= config.min_profit_factor * loss_count
+        )
+        high_frequency = stats.trades_per_day >= config.high_frequency_threshold
 
-        # Check profit factor
-        if stats.win_count > 0 and stats.loss_count > 0:
-            # Approximate profit factor from win/loss ratio
-            # (In reality we'd need actual P&L amounts, but this is an estimate)
-            approx_profit_factor = stats.win_count / stats.loss_count
-            if approx_profit_factor >= self.config.min_profit_factor:
-                reasons.append(f"High profit factor: {approx_profit_factor:.2f}x")
+        # Need at least 2 reasons to flag
+        if high_win_rate + high_profit_factor + high_frequency < 2:
+            return None
 
-        # Check trading frequency
-        if stats.trades_per_day >= self.config.high_frequency_threshold:
+        reasons = []
+        if high_win_rate:
+            reasons.append(f"High win rate: {stats.win_rate * 100:.1f}%")
+        if high_profit_factor:
+            reasons.append(f"High profit factor: {win_count / loss_count:.2f}x")
+        if high_frequency:
             reasons.append(
                 f"High-frequency trading: {stats.trades_per_day:.0f} trades/day"
             )
 
-        # Need at least 2 reasons to flag
-        if len(reasons) < 2:
-            return None
-
         return Alert(
             id=None,
             created_at=datetime.now(),
@@ -226,16 +285,14 @@ class ProfitableTraderDetector:
         """Get all tracked wallet statistics."""
         return list(self._wallet_stats.values())
 
-    def get_suspicious_wallets(self) -> list[WalletStats]:
-        """Get wallets that meet suspicious criteria."""
-        suspicious = []
-        for stats in self._wallet_stats.values():
-            if stats.trade_count < self.config.min_trades_for_analysis:
-                continue
-
-            if stats.win_rate >= self.config.min_win_rate:
-                suspicious.append(stats)
-            elif stats.trades_per_day >= self.config.high_frequency_threshold:
-                suspicious.append(stats)
+    def get_suspicious_wallets(self, limit: int | None = None) -> list[WalletStats]:
+        """
+        Get wallets that meet suspicious criteria, highest estimated P&L first.
 
+        Args:
+            limit: Return only this many wallets
+        """
+        suspicious = (self._wallet_stats[wallet] for wallet in self._suspicious_wallets)
+        if limit is not None:
+            return heapq.nlargest(limit, suspicious, key=lambda s: s.estimated_pnl)
         return sorted(suspicious, key=lambda s: s.estimated_pnl, reverse=True)
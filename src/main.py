@@ -37,6 +37,7 @@ class PolymarketWatcher:
             log_level=config.logging.level,
             max_file_size_mb=config.logging.max_file_size_mb,
             backup_count=config.logging.backup_count,
+            rotation_mode=config.logging.rotation_mode,
         )
 
         # Detection engine
@@ -67,6 +68,7 @@ class PolymarketWatcher:
             repository=self.repository,
             data_api=self.data_api,
         )
+        await low_history_detector.load_established_wallets()
         self.engine.add_detector(low_history_detector)
 
         # Set up profitable trader detector
@@ -99,9 +101,13 @@ class PolymarketWatcher:
         logger.info("Stopping Polymarket Watcher...")
         self._running = False
 
+        # disconnect() returns once received trades have been processed, so
+        # the engine and database are still open for them
         await self.ws_client.disconnect()
+        await self.engine.close()
         await self.data_api.close()
         await self.repository.close()
+        self.alert_logger.close()
 
         # Log final stats
         stats = self.engine.stats
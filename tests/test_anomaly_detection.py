@@ -6,10 +6,17 @@ to verify they correctly identify anomalous behavior patterns.
 """
 
 import asyncio
+import json
+import time
 from dataclasses import dataclass
+from pathlib import Path
 
 import httpx
 
+# Fetched stats are cached on disk so reruns on the same day skip the API
+CACHE_DIR = Path(__file__).parent / ".cache" / "wallet_stats"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
 
 @dataclass
 class TestAccount:
@@ -41,34 +48,53 @@ TEST_ACCOUNTS = [
 ]
 
 
-async def get_wallet_stats(address: str) -> dict:
-    """Fetch wallet statistics from the API."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(
-            "https://data-api.polymarket.com/activity",
-            params={"user": address, "limit": 500, "type": "TRADE"},
-        )
-        resp.raise_for_status()
-        trades = resp.json()
+async def get_wallet_stats(address: str, client: httpx.AsyncClient) -> dict:
+    """Get wallet statistics, from the on-disk cache if fresh."""
+    cache_file = CACHE_DIR / f"{address.lower()}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < CACHE_TTL_SECONDS:
+            return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        pass
+
+    stats = await fetch_wallet_stats(address, client)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps(stats))
+    return stats
 
-        if not trades:
-            return {
-                "trade_count": 0,
-                "total_volume": 0,
-                "max_trade": 0,
-                "avg_trade": 0,
-            }
 
-        total_volume = sum(float(t.get("usdcSize", 0)) for t in trades)
-        max_trade = max(float(t.get("usdcSize", 0)) for t in trades)
+async def fetch_wallet_stats(address: str, client: httpx.AsyncClient) -> dict:
+    """Fetch wallet statistics from the API."""
+    resp = await client.get(
+        "https://data-api.polymarket.com/activity",
+        params={"user": address, "limit": 500, "type": "TRADE"},
+    )
+    resp.raise_for_status()
+    trades = resp.json()
 
+    if not trades:
         return {
-            "trade_count": len(trades),
-            "total_volume": total_volume,
-            "max_trade": max_trade,
-            "avg_trade": total_volume / len(trades) if trades else 0,
+            "trade_count": 0,
+            "total_volume": 0,
+            "max_trade": 0,
+            "avg_trade": 0,
         }
 
+    total_volume = 0.0
+    max_trade = 0.0
+    for t in trades:
+        size = float(t.get("usdcSize", 0))
+        total_volume += size
+        if size > max_trade:
+            max_trade = size
+
+    return {
+        "trade_count": len(trades),
+        "total_volume": total_volume,
+        "max_trade": max_trade,
+        "avg_trade": total_volume / len(trades) if trades else 0,
+    }
+
 
 def check_low_history_detection(
     stats: dict,
@@ -96,7 +122,9 @@ def check_concentrated_detection(
     )
 
 
-async def test_account(account: TestAccount) -> tuple[bool, str]:
+async def test_account(
+    account: TestAccount, client: httpx.AsyncClient
+) -> tuple[bool, str]:
     """
     Test a single account against detection rules.
 
@@ -104,7 +132,7 @@ async def test_account(account: TestAccount) -> tuple[bool, str]:
         (passed, message) tuple
     """
     try:
-        stats = await get_wallet_stats(account.address)
+        stats = await get_wallet_stats(account.address, client)
     except Exception as e:
         return False, f"Failed to fetch stats: {e}"
 
@@ -145,13 +173,21 @@ async def run_all_tests() -> None:
     passed = 0
     failed = 0
 
-    for account in TEST_ACCOUNTS:
+    # Fetch all accounts concurrently over one pooled client
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(max_connections=32),
+    ) as client:
+        results = await asyncio.gather(
+            *(test_account(account, client) for account in TEST_ACCOUNTS)
+        )
+
+    for account, (success, message) in zip(TEST_ACCOUNTS, results, strict=True):
         name = account.username or account.address[:12] + "..."
         print(f"Testing: {name}")
         print(f"  Description: {account.description}")
 
-        success, message = await test_account(account)
-
         if success:
             print(f"  Result: \033[92mPASS\033[0m - {message}")
             passed += 1